@@ -2,23 +2,25 @@
 from __future__ import annotations
 
 import argparse
-import json
 from dataclasses import dataclass
-from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Callable, Mapping
+from typing import TYPE_CHECKING, Any, Callable, Mapping
 
 from .config import GraphitiConfig, load_config
 from .episodes import Neo4jEpisodeStore
-from .health import collect_health_metrics, format_dashboard
 from .ops import create_state_backup, restore_state_backup
-from .pollers.calendar import CalendarPoller
-from .pollers.drive import DrivePoller
-from .pollers.gmail import GmailPoller
-from .pollers.slack import SlackPoller
+from .pollers.slack import SlackPoller, channel_inventory
 from .state import GraphitiStateStore
+from .utils import dumps_json, utc_now_iso
 
-DEFAULT_INDENT = 2
+if TYPE_CHECKING:  # pragma: no cover - imported lazily by the commands that need them
+    from .pollers.calendar import CalendarPoller
+    from .pollers.drive import DrivePoller
+    from .pollers.gmail import GmailPoller
+
+
+SCHEDULER_SOURCES = ("gmail", "drive", "calendar", "slack")
 
 
 def build_parser() -> argparse.ArgumentParser:
@@ -91,9 +93,27 @@ def build_parser() -> argparse.ArgumentParser:
     )
     restore_state.set_defaults(func=cmd_restore_state)
 
+    schema = sub.add_parser("schema", help="Neo4j schema utilities")
+    schema_sub = schema.add_subparsers(dest="schema_command", required=True)
+    schema_init = schema_sub.add_parser(
+        "init", help="Create the Neo4j indexes used by search and sync"
+    )
+    schema_init.set_defaults(func=cmd_schema_init)
+
     return parser
 
 
+@lru_cache(maxsize=1)
+def _shared_parser() -> argparse.ArgumentParser:
+    """Build the parser once per process; parsing does not mutate it."""
+
+    return build_parser()
+
+
+def _print_json(payload: Any) -> None:
+    print(dumps_json(payload, indent=True, sort_keys=True))
+
+
 def _bootstrap() -> tuple[GraphitiConfig, GraphitiStateStore]:
     config = load_config()
     state = GraphitiStateStore()
@@ -127,15 +147,17 @@ def cmd_status(_: argparse.Namespace) -> int:
         "tokens_path_exists": state.tokens_path.exists(),
         "state_path_exists": state.state_path.exists(),
     }
-    print(json.dumps(payload, indent=DEFAULT_INDENT, sort_keys=True))
+    _print_json(payload)
     return 0
 
 
 def cmd_sync_status(args: argparse.Namespace) -> int:
+    from .health import collect_health_metrics, format_dashboard
+
     config, state = _bootstrap()
     metrics = collect_health_metrics(state, config)
     if getattr(args, "json", False):
-        print(json.dumps(metrics, indent=DEFAULT_INDENT, sort_keys=True))
+        _print_json(metrics)
     else:
         print(format_dashboard(metrics))
     return 0
@@ -154,9 +176,9 @@ def cmd_sync_poller(args: argparse.Namespace) -> int:
     payload = {
         "source": args.poller_name,
         "processed": processed,
-        "ran_at": datetime.now(timezone.utc).isoformat(),
+        "ran_at": utc_now_iso(),
     }
-    print(json.dumps(payload, indent=DEFAULT_INDENT, sort_keys=True))
+    _print_json(payload)
     return 0
 
 
@@ -171,16 +193,12 @@ def cmd_sync_slack(args: argparse.Namespace) -> int:
             state.update_state(
                 {
                     "slack": {
-                        "channels": {
-                            str(c.get("id")): {"metadata": dict(c)}
-                            for c in channels
-                            if isinstance(c, Mapping) and c.get("id")
-                        },
-                        "last_inventory_at": datetime.now(timezone.utc).isoformat(),
+                        "channels": channel_inventory(channels),
+                        "last_inventory_at": utc_now_iso(),
                     }
                 }
             )
-            print(json.dumps(channels, indent=DEFAULT_INDENT, sort_keys=True))
+            _print_json(channels)
             return 0
 
         poller = SlackPoller(
@@ -192,9 +210,9 @@ def cmd_sync_slack(args: argparse.Namespace) -> int:
         payload = {
             "source": "slack",
             "processed": processed,
-            "ran_at": datetime.now(timezone.utc).isoformat(),
+            "ran_at": utc_now_iso(),
         }
-        print(json.dumps(payload, indent=DEFAULT_INDENT, sort_keys=True))
+        _print_json(payload)
         return 0
     finally:
         close_episode_store(episode_store)
@@ -208,35 +226,35 @@ def cmd_sync_scheduler(args: argparse.Namespace) -> int:
             "poll_slack_active_seconds": config.poll_slack_active_seconds,
             "poll_slack_idle_seconds": config.poll_slack_idle_seconds,
         }
-        print(json.dumps(payload, indent=DEFAULT_INDENT, sort_keys=True))
+        _print_json(payload)
         return 0
 
-    metrics: list[dict[str, Any]] = []
+    from concurrent.futures import ThreadPoolExecutor
+
     episode_store = create_episode_store(config)
+
+    def run_poller(name: str) -> int:
+        if name == "slack":
+            slack_client = create_slack_client(config, state)
+            return SlackPoller(slack_client, episode_store, state).run_once()
+        return POLLER_FACTORIES[name](config, state, episode_store).run_once()
+
+    # Each poller is bound by its own remote API, so run them side by side and
+    # report in a fixed order. The shared driver hands each task its own session.
     try:
-        for name in ("gmail", "drive", "calendar"):
-            poller = POLLER_FACTORIES[name](config, state, episode_store)
-            metrics.append(
-                {
-                    "source": name,
-                    "processed": poller.run_once(),
-                }
-            )
-        slack_client = create_slack_client(config, state)
-        slack_poller = SlackPoller(
-            slack_client,
-            episode_store,
-            state,
-        )
-        metrics.append({"source": "slack", "processed": slack_poller.run_once()})
+        with ThreadPoolExecutor(max_workers=len(SCHEDULER_SOURCES)) as executor:
+            futures = [(name, executor.submit(run_poller, name)) for name in SCHEDULER_SOURCES]
+            metrics = [
+                {"source": name, "processed": future.result()} for name, future in futures
+            ]
     finally:
         close_episode_store(episode_store)
 
     payload = {
-        "ran_at": datetime.now(timezone.utc).isoformat(),
+        "ran_at": utc_now_iso(),
         "metrics": metrics,
     }
-    print(json.dumps(payload, indent=DEFAULT_INDENT, sort_keys=True))
+    _print_json(payload)
     return 0
 
 
@@ -245,7 +263,7 @@ def cmd_backup_state(args: argparse.Namespace) -> int:
     destination = Path(args.output) if getattr(args, "output", None) else None
     archive = create_state_backup(state, destination=destination)
     payload = {"backup_path": str(archive)}
-    print(json.dumps(payload, indent=DEFAULT_INDENT, sort_keys=True))
+    _print_json(payload)
     return 0
 
 
@@ -257,7 +275,23 @@ def cmd_restore_state(args: argparse.Namespace) -> int:
         "restored_from": str(archive),
         "state_path": str(restored),
     }
-    print(json.dumps(payload, indent=DEFAULT_INDENT, sort_keys=True))
+    _print_json(payload)
+    return 0
+
+
+def cmd_schema_init(_: argparse.Namespace) -> int:
+    config, _ = _bootstrap()
+    episode_store = create_episode_store(config)
+    try:
+        episode_store.ensure_indexes()
+    finally:
+        close_episode_store(episode_store)
+
+    payload = {
+        "group_id": config.group_id,
+        "indexes_ensured_at": utc_now_iso(),
+    }
+    _print_json(payload)
     return 0
 def create_episode_store(config: GraphitiConfig) -> Neo4jEpisodeStore:
     driver = create_neo4j_driver(config)
@@ -288,6 +322,8 @@ def create_gmail_poller(
     state: GraphitiStateStore,
     episode_store: Neo4jEpisodeStore,
 ) -> GmailPoller:
+    from .pollers.gmail import GmailPoller
+
     client = create_gmail_client(config, state)
     return GmailPoller(client, episode_store, state, config)
 
@@ -297,6 +333,8 @@ def create_drive_poller(
     state: GraphitiStateStore,
     episode_store: Neo4jEpisodeStore,
 ) -> DrivePoller:
+    from .pollers.drive import DrivePoller
+
     client = create_drive_client(config, state)
     return DrivePoller(client, episode_store, state, config)
 
@@ -306,6 +344,8 @@ def create_calendar_poller(
     state: GraphitiStateStore,
     episode_store: Neo4jEpisodeStore,
 ) -> CalendarPoller:
+    from .pollers.calendar import CalendarPoller
+
     client = create_calendar_client(config, state)
     return CalendarPoller(client, episode_store, state, config.calendar_ids, config)
 
@@ -401,11 +441,12 @@ COMMAND_HANDLERS = {
     "sync": lambda args: args.func(args),
     "backup": lambda args: args.func(args),
     "restore": lambda args: args.func(args),
+    "schema": lambda args: args.func(args),
 }
 
 
 def main(argv: list[str] | None = None) -> int:
-    parser = build_parser()
+    parser = _shared_parser()
     args = parser.parse_args(argv)
     handler = COMMAND_HANDLERS.get(args.command)
     if handler is None:
@@ -3,10 +3,14 @@ from __future__ import annotations
 
 from dataclasses import dataclass, asdict
 from pathlib import Path
-from typing import Any, Dict, Iterable, Mapping, Optional
+from typing import Any, Callable, Dict, Iterable, Mapping, Optional
+import json
 import os
+import re
+import threading
 
 from .state import STATE_DIR_NAME
+from .utils import dumps_json, loads_json
 
 
 DEFAULT_DOTENV_PATH = Path(".env")
@@ -17,17 +21,13 @@ CONFIG_PATH_ENV = "GRAPHITI_CONFIG_PATH"
 def _normalise_sequence(values: Iterable[str] | None) -> tuple[str, ...]:
     if not values:
         return ()
-    normalised: list[str] = []
-    seen: set[str] = set()
+    # Case-folded key -> first spelling seen; dicts keep insertion order.
+    normalised: dict[str, str] = {}
     for value in values:
         candidate = value.strip()
-        if not candidate:
-            continue
-        if candidate.lower() in seen:
-            continue
-        seen.add(candidate.lower())
-        normalised.append(candidate)
-    return tuple(normalised)
+        if candidate:
+            normalised.setdefault(candidate.lower(), candidate)
+    return tuple(normalised.values())
 
 
 def _clean_optional_str(value: Any | None, default: str | None) -> str | None:
@@ -42,7 +42,7 @@ def _clean_optional_str(value: Any | None, default: str | None) -> str | None:
 DEFAULT_BACKUP_DIR = str((Path.home() / STATE_DIR_NAME / "backups").resolve())
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GraphitiConfig:
     """Application configuration persisted to `config.json`."""
 
@@ -60,6 +60,12 @@ class GraphitiConfig:
     drive_backfill_days: int = 365
     calendar_backfill_days: int = 365
     slack_backfill_days: int = 365
+    # Fetch threads per poll. Raise above 1 only with a thread-safe client;
+    # googleapiclient service objects are not.
+    gmail_fetch_concurrency: int = 1
+    drive_fetch_concurrency: int = 1
+    gmail_batch_size: int = 50
+    thread_pool_size: int = 8
     slack_search_query: str = ""
     calendar_ids: tuple[str, ...] = ("primary",)
     redaction_rules_path: str | None = None
@@ -82,90 +88,14 @@ class GraphitiConfig:
     ) -> "GraphitiConfig":
         """Create a configuration instance from a key/value mapping."""
 
+        if not values:
+            return defaults or cls()
         defaults = defaults or cls()
-
-        def get_int(key: str, default: int) -> int:
-            raw = values.get(key)
-            if raw is None or raw.strip() == "":
-                return default
-            try:
-                return int(raw)
-            except ValueError as exc:
-                raise ValueError(f"Invalid integer for {key}: {raw!r}") from exc
-
         return cls(
-            neo4j_uri=values.get("NEO4J_URI", defaults.neo4j_uri),
-            neo4j_user=values.get("NEO4J_USER", defaults.neo4j_user),
-            neo4j_password=values.get("NEO4J_PASS", defaults.neo4j_password),
-            google_client_id=values.get("GOOGLE_CLIENT_ID", defaults.google_client_id),
-            google_client_secret=values.get(
-                "GOOGLE_CLIENT_SECRET", defaults.google_client_secret
-            ),
-            group_id=values.get("GROUP_ID", defaults.group_id),
-            poll_gmail_drive_calendar_seconds=get_int(
-                "POLL_GMAIL_DRIVE_CAL", defaults.poll_gmail_drive_calendar_seconds
-            ),
-            poll_slack_active_seconds=get_int(
-                "POLL_SLACK_ACTIVE", defaults.poll_slack_active_seconds
-            ),
-            poll_slack_idle_seconds=get_int(
-                "POLL_SLACK_IDLE", defaults.poll_slack_idle_seconds
-            ),
-            gmail_fallback_days=get_int(
-                "GMAIL_FALLBACK_DAYS", defaults.gmail_fallback_days
-            ),
-            gmail_backfill_days=get_int(
-                "GMAIL_BACKFILL_DAYS", defaults.gmail_backfill_days
-            ),
-            drive_backfill_days=get_int(
-                "DRIVE_BACKFILL_DAYS", defaults.drive_backfill_days
-            ),
-            calendar_backfill_days=get_int(
-                "CALENDAR_BACKFILL_DAYS", defaults.calendar_backfill_days
-            ),
-            slack_backfill_days=get_int(
-                "SLACK_BACKFILL_DAYS", defaults.slack_backfill_days
-            ),
-            slack_search_query=(
-                _clean_optional_str(
-                    values.get("SLACK_SEARCH_QUERY"), defaults.slack_search_query
-                )
-                or ""
-            ),
-            calendar_ids=_parse_csv(
-                values.get("CALENDAR_IDS"), defaults.calendar_ids
-            ),
-            redaction_rules_path=values.get(
-                "REDACTION_RULES_PATH", defaults.redaction_rules_path
-            ),
-            redaction_rules=_parse_redaction_rules(
-                values.get("REDACTION_RULES"), defaults.redaction_rules
-            ),
-            summarization_strategy=values.get(
-                "SUMMARY_STRATEGY", defaults.summarization_strategy
-            ),
-            summarization_threshold=get_int(
-                "SUMMARY_THRESHOLD", defaults.summarization_threshold
-            ),
-            summarization_max_chars=get_int(
-                "SUMMARY_MAX_CHARS", defaults.summarization_max_chars
-            ),
-            summarization_sentence_count=get_int(
-                "SUMMARY_SENTENCE_COUNT", defaults.summarization_sentence_count
-            ),
-            backup_directory=_clean_optional_str(
-                values.get("BACKUP_DIRECTORY"), defaults.backup_directory
-            )
-            or defaults.backup_directory,
-            backup_retention_days=get_int(
-                "BACKUP_RETENTION_DAYS", defaults.backup_retention_days
-            ),
-            log_retention_days=get_int(
-                "LOG_RETENTION_DAYS", defaults.log_retention_days
-            ),
-            logs_directory=_clean_optional_str(
-                values.get("LOGS_DIRECTORY"), defaults.logs_directory
-            ),
+            **{
+                name: parse(values.get(key), getattr(defaults, name), key)
+                for name, key, parse in _ENV_FIELD_SPEC
+            }
         )
 
     @classmethod
@@ -201,7 +131,8 @@ class GraphitiConfig:
                 return default
             if isinstance(value, str):
                 return _parse_csv(value, default)
-            if isinstance(value, Iterable):
+            # JSON yields lists; the concrete check skips the slower ABC lookup.
+            if isinstance(value, (list, tuple)) or isinstance(value, Iterable):
                 return _normalise_sequence(str(item) for item in value)
             return default
 
@@ -214,7 +145,7 @@ class GraphitiConfig:
             candidates: list[tuple[str, str]] = []
             if isinstance(value, str):
                 return _parse_redaction_rules(value, default)
-            if isinstance(value, Iterable):
+            if isinstance(value, (list, tuple)) or isinstance(value, Iterable):
                 for entry in value:
                     if isinstance(entry, Mapping):
                         pattern = entry.get("pattern")
@@ -259,6 +190,14 @@ class GraphitiConfig:
             slack_backfill_days=get_int(
                 "slack_backfill_days", defaults.slack_backfill_days
             ),
+            gmail_fetch_concurrency=get_int(
+                "gmail_fetch_concurrency", defaults.gmail_fetch_concurrency
+            ),
+            drive_fetch_concurrency=get_int(
+                "drive_fetch_concurrency", defaults.drive_fetch_concurrency
+            ),
+            gmail_batch_size=get_int("gmail_batch_size", defaults.gmail_batch_size),
+            thread_pool_size=get_int("thread_pool_size", defaults.thread_pool_size),
             slack_search_query=get_str(
                 "slack_search_query", defaults.slack_search_query
             ).strip(),
@@ -310,10 +249,7 @@ class GraphitiConfig:
 def _parse_csv(raw: Optional[str], default: tuple[str, ...]) -> tuple[str, ...]:
     if raw is None:
         return default
-    items = [item.strip() for item in str(raw).split(",") if str(item).strip()]
-    if not items:
-        return ()
-    return tuple(dict.fromkeys(items))
+    return tuple(dict.fromkeys(item for part in str(raw).split(",") if (item := part.strip())))
 
 
 def _parse_redaction_rules(
@@ -324,8 +260,6 @@ def _parse_redaction_rules(
     raw_str = str(raw).strip()
     candidates: list[tuple[str, str]] = []
     try:
-        import json
-
         data = json.loads(raw_str)
     except Exception:  # pragma: no cover - defensive JSON parsing fallback
         parts = [segment.strip() for segment in raw_str.split(";;") if segment.strip()]
@@ -352,22 +286,115 @@ def _parse_redaction_rules(
     return default
 
 
+def _env_str(raw: Optional[str], default: Any, key: str) -> Any:
+    return default if raw is None else raw
+
+
+def _env_int(raw: Optional[str], default: int, key: str) -> int:
+    if raw is None or raw.strip() == "":
+        return default
+    try:
+        return int(raw)
+    except ValueError as exc:
+        raise ValueError(f"Invalid integer for {key}: {raw!r}") from exc
+
+
+def _env_optional_str(raw: Optional[str], default: str | None, key: str) -> str | None:
+    return _clean_optional_str(raw, default)
+
+
+def _env_query(raw: Optional[str], default: str, key: str) -> str:
+    return _clean_optional_str(raw, default) or ""
+
+
+def _env_csv(raw: Optional[str], default: tuple[str, ...], key: str) -> tuple[str, ...]:
+    return _parse_csv(raw, default)
+
+
+def _env_rules(
+    raw: Optional[str], default: tuple[tuple[str, str], ...], key: str
+) -> tuple[tuple[str, str], ...]:
+    return _parse_redaction_rules(raw, default)
+
+
+# (field name, environment key, parser) for GraphitiConfig.from_mapping. Each
+# parser receives the raw value (None when unset), the default and the key.
+_ENV_FIELD_SPEC: tuple[tuple[str, str, Callable[[Optional[str], Any, str], Any]], ...] = (
+    ("neo4j_uri", "NEO4J_URI", _env_str),
+    ("neo4j_user", "NEO4J_USER", _env_str),
+    ("neo4j_password", "NEO4J_PASS", _env_str),
+    ("google_client_id", "GOOGLE_CLIENT_ID", _env_str),
+    ("google_client_secret", "GOOGLE_CLIENT_SECRET", _env_str),
+    ("group_id", "GROUP_ID", _env_str),
+    ("poll_gmail_drive_calendar_seconds", "POLL_GMAIL_DRIVE_CAL", _env_int),
+    ("poll_slack_active_seconds", "POLL_SLACK_ACTIVE", _env_int),
+    ("poll_slack_idle_seconds", "POLL_SLACK_IDLE", _env_int),
+    ("gmail_fallback_days", "GMAIL_FALLBACK_DAYS", _env_int),
+    ("gmail_backfill_days", "GMAIL_BACKFILL_DAYS", _env_int),
+    ("drive_backfill_days", "DRIVE_BACKFILL_DAYS", _env_int),
+    ("calendar_backfill_days", "CALENDAR_BACKFILL_DAYS", _env_int),
+    ("slack_backfill_days", "SLACK_BACKFILL_DAYS", _env_int),
+    ("gmail_fetch_concurrency", "GMAIL_FETCH_CONCURRENCY", _env_int),
+    ("drive_fetch_concurrency", "DRIVE_FETCH_CONCURRENCY", _env_int),
+    ("gmail_batch_size", "GMAIL_BATCH_SIZE", _env_int),
+    ("thread_pool_size", "THREAD_POOL_SIZE", _env_int),
+    ("slack_search_query", "SLACK_SEARCH_QUERY", _env_query),
+    ("calendar_ids", "CALENDAR_IDS", _env_csv),
+    ("redaction_rules_path", "REDACTION_RULES_PATH", _env_str),
+    ("redaction_rules", "REDACTION_RULES", _env_rules),
+    ("summarization_strategy", "SUMMARY_STRATEGY", _env_str),
+    ("summarization_threshold", "SUMMARY_THRESHOLD", _env_int),
+    ("summarization_max_chars", "SUMMARY_MAX_CHARS", _env_int),
+    ("summarization_sentence_count", "SUMMARY_SENTENCE_COUNT", _env_int),
+    ("backup_directory", "BACKUP_DIRECTORY", _env_optional_str),
+    ("backup_retention_days", "BACKUP_RETENTION_DAYS", _env_int),
+    ("log_retention_days", "LOG_RETENTION_DAYS", _env_int),
+    ("logs_directory", "LOGS_DIRECTORY", _env_optional_str),
+)
+
+
+# ``KEY=VALUE`` on one line, skipping ``#`` comments. Surrounding whitespace
+# and then runs of double/single quotes are trimmed by the pattern itself,
+# matching the original ``strip().strip('"').strip("'")`` behaviour.
+_DOTENV_LINE = re.compile(
+    r"""^(?![^\S\n]*\#)[^\S\n]*([^=\n]*?)[^\S\n]*=[^\S\n]*"*'*(.*?)'*"*[^\S\n]*$""",
+    re.MULTILINE,
+)
+
+
+# Parsed files keyed by path and validated against (mtime_ns, size, inode), so
+# repeated load_config() calls cost one stat() while the files are unchanged.
+_CACHE_LOCK = threading.Lock()
+_CONFIG_CACHE: Dict[Path, tuple[tuple[int, int, int], "GraphitiConfig"]] = {}
+_DOTENV_CACHE: Dict[Path, tuple[tuple[int, int, int], Dict[str, str]]] = {}
+_MERGED_CACHE: Dict[
+    Path, tuple["GraphitiConfig", tuple[tuple[str, str], ...], "GraphitiConfig"]
+] = {}
+
+
+def _stat_key(st: os.stat_result) -> tuple[int, int, int]:
+    return (st.st_mtime_ns, st.st_size, st.st_ino)
+
+
 def _parse_dotenv(path: Path) -> Dict[str, str]:
     """Parse a minimal .env file into a dictionary."""
 
-    data: Dict[str, str] = {}
-    if not path.exists():
-        return data
-
-    for line in path.read_text().splitlines():
-        striped = line.strip()
-        if not striped or striped.startswith("#"):
-            continue
-        if "=" not in striped:
-            continue
-        key, value = striped.split("=", 1)
-        data[key.strip()] = value.strip().strip('"').strip("'")
-    return data
+    try:
+        key = _stat_key(path.stat())
+    except FileNotFoundError:
+        return {}
+    with _CACHE_LOCK:
+        cached = _DOTENV_CACHE.get(path)
+    if cached is not None and cached[0] == key:
+        return dict(cached[1])
+    try:
+        text = path.read_text()
+    except FileNotFoundError:
+        return {}
+    data = dict(_DOTENV_LINE.findall(text))
+    with _CACHE_LOCK:
+        _DOTENV_CACHE[path] = (key, data)
+    return dict(data)
 
 
 class ConfigStore:
@@ -385,16 +412,31 @@ class ConfigStore:
         self.path = path
 
     def load(self) -> GraphitiConfig:
-        if not self.path.exists():
+        with _CACHE_LOCK:
+            cached = _CONFIG_CACHE.get(self.path)
+        try:
+            key = _stat_key(self.path.stat())
+        except FileNotFoundError:
             config = GraphitiConfig()
             self.save(config)
+            with _CACHE_LOCK:
+                _CONFIG_CACHE[self.path] = (_stat_key(self.path.stat()), config)
             return config
+        except OSError:
+            if cached is not None:
+                return cached[1]
+            raise
+        if cached is not None and cached[0] == key:
+            return cached[1]
 
         with self.path.open("r", encoding="utf-8") as fh:
             data = json_load(fh)
         if not isinstance(data, Mapping):
             raise ValueError("Invalid configuration file contents")
-        return GraphitiConfig.from_json(data)
+        config = GraphitiConfig.from_json(data)
+        with _CACHE_LOCK:
+            _CONFIG_CACHE[self.path] = (key, config)
+        return config
 
     def save(self, config: GraphitiConfig | Mapping[str, Any]) -> GraphitiConfig:
         if isinstance(config, Mapping):
@@ -412,16 +454,11 @@ class ConfigStore:
 
 
 def json_load(handle) -> Any:
-    import json
-
-    return json.load(handle)
+    return loads_json(handle.read())
 
 
 def json_dump(payload: Mapping[str, Any], handle) -> None:
-    import json
-
-    json.dump(payload, handle, indent=2, sort_keys=True)
-    handle.write("\n")
+    handle.write(dumps_json(payload, indent=True, sort_keys=True) + "\n")
 
 
 def load_config(
@@ -435,23 +472,30 @@ def load_config(
     config_store = store or ConfigStore()
     config = config_store.load()
 
-    overrides: Dict[str, str] = {}
-    if dotenv_path is not None:
-        overrides.update(_parse_dotenv(dotenv_path))
-    elif DEFAULT_DOTENV_PATH.exists():
-        overrides.update(_parse_dotenv(DEFAULT_DOTENV_PATH))
+    # A missing .env parses to no overrides, so no separate exists() check.
+    overrides = _parse_dotenv(dotenv_path if dotenv_path is not None else DEFAULT_DOTENV_PATH)
 
     env_mapping = os.environ if environ is None else environ
-    overrides.update(
-        {k: v for k, v in env_mapping.items() if k.upper() in ENV_KEYS}
-    )
-
-    if overrides:
-        config = GraphitiConfig.from_mapping(overrides, defaults=config)
-    return config
-
-
-ENV_KEYS = {
+    # from_mapping only reads upper-case names, so probe those directly rather
+    # than scanning (and upper-casing) every variable in the environment.
+    overrides.update((k, env_mapping[k]) for k in ENV_KEYS if k in env_mapping)
+
+    if not overrides:
+        return config
+    # Reuse the merged config while both the stored config (cached by
+    # ConfigStore until the file changes) and the overrides are unchanged.
+    key = tuple(overrides.items())
+    with _CACHE_LOCK:
+        cached = _MERGED_CACHE.get(config_store.path)
+    if cached is not None and cached[0] is config and cached[1] == key:
+        return cached[2]
+    merged = GraphitiConfig.from_mapping(overrides, defaults=config)
+    with _CACHE_LOCK:
+        _MERGED_CACHE[config_store.path] = (config, key, merged)
+    return merged
+
+
+ENV_KEYS = frozenset({
     "NEO4J_URI",
     "NEO4J_USER",
     "NEO4J_PASS",
@@ -464,6 +508,10 @@ ENV_KEYS = {
     "DRIVE_BACKFILL_DAYS",
     "CALENDAR_BACKFILL_DAYS",
     "SLACK_BACKFILL_DAYS",
+    "GMAIL_FETCH_CONCURRENCY",
+    "DRIVE_FETCH_CONCURRENCY",
+    "GMAIL_BATCH_SIZE",
+    "THREAD_POOL_SIZE",
     "SLACK_SEARCH_QUERY",
     "CALENDAR_IDS",
     "REDACTION_RULES_PATH",
@@ -476,7 +524,7 @@ ENV_KEYS = {
     "BACKUP_RETENTION_DAYS",
     "LOG_RETENTION_DAYS",
     "LOGS_DIRECTORY",
-}
+})
 
 
 __all__ = ["GraphitiConfig", "ConfigStore", "load_config"]
@@ -1,26 +1,207 @@
 """Cursor tool integration for Graphiti."""
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, Callable, Mapping
+import re
+import time
+from typing import Any, Callable, Final, Iterable, Iterator, Mapping
+
+from .episodes import EPISODE_TEXT_INDEX, READ_ACCESS
+from .utils import loads_json
+
+DEFAULT_TEXT_LIMIT = 500
+
+_LUCENE_SPECIAL = re.compile(r'([+\-&|!(){}\[\]^"~*?:\\/])')
+_LUCENE_KEYWORDS = re.compile(r"\b(?:AND|OR|NOT)\b")
+# How long hybrid search scans before trying a missing full-text index again.
+_FULLTEXT_RETRY_SECONDS = 60.0
+
+
+# Cypher statements are module constants so every call sends identical text and
+# reuses the server's cached plan; optional filters are expressed as parameters.
+_HYBRID_SEARCH_MATCH = f"""
+CALL db.index.fulltext.queryNodes('{EPISODE_TEXT_INDEX}', $query) YIELD node AS e
+WHERE e.group_id = $group_id AND ($source IS NULL OR e.source = $source)
+"""
+
+# Used when the full-text index has not been created yet. The needle is
+# lower-cased once in Python so only the stored text is transformed per row.
+_HYBRID_SCAN_MATCH = """
+MATCH (e:Episode {group_id: $group_id})
+WHERE ($source IS NULL OR e.source = $source) AND toLower(e.text) CONTAINS $needle
+"""
+
+# Metadata and raw JSON payloads are only shipped when the caller asks for them.
+_SUMMARY_RETURN = """WITH e ORDER BY e.valid_at DESC LIMIT $limit
+RETURN e {
+    .episode_id, .group_id, .source, .native_id, .version, .valid_at, .invalid_at,
+    text: substring(e.text, 0, $text_limit)
+} AS e
+"""
+
+_FULL_RETURN = """WITH e ORDER BY e.valid_at DESC LIMIT $limit
+RETURN e {.*, text: substring(e.text, 0, $text_limit)} AS e
+"""
+
+_HYBRID_SEARCH_CYPHER: Final[str] = _HYBRID_SEARCH_MATCH + _SUMMARY_RETURN
+_HYBRID_SEARCH_METADATA_CYPHER: Final[str] = _HYBRID_SEARCH_MATCH + _FULL_RETURN
+_HYBRID_SCAN_CYPHER: Final[str] = _HYBRID_SCAN_MATCH + _SUMMARY_RETURN
+_HYBRID_SCAN_METADATA_CYPHER: Final[str] = _HYBRID_SCAN_MATCH + _FULL_RETURN
+
+_AS_OF_CYPHER: Final[str] = """
+MATCH (e:Episode {group_id: $group_id, source: $source, native_id: $native_id})
+WHERE datetime(e.valid_at) <= datetime($as_of)
+RETURN e ORDER BY e.valid_at DESC LIMIT 1
+"""
+
+_SHORTEST_PATH_CYPHER: Final[str] = """
+MATCH (start:Episode {group_id: $group_id, source: $source, native_id: $source_native_id})
+MATCH (target:Episode {group_id: $group_id, source: $source, native_id: $target_native_id})
+MATCH p = shortestPath((start)-[*..$max_depth]-(target))
+RETURN [node IN nodes(p) | node] AS nodes
+"""
+
+
+def _escape_lucene(query: str) -> str:
+    """Escape Lucene operators so user queries are matched as plain terms.
+
+    The boolean keywords are only operators in upper case, so they are
+    lower-cased rather than escaped.
+    """
+
+    escaped = _LUCENE_SPECIAL.sub(r"\\\1", query)
+    return _LUCENE_KEYWORDS.sub(lambda match: match.group(0).lower(), escaped)
+
+
+_JSON_PROPERTIES = ("metadata", "json")
+
+
+def _decode_json_properties(properties: Mapping[str, Any]) -> dict[str, Any]:
+    """Decode map properties that Neo4j stores as JSON strings.
+
+    Each row is parsed afresh, so callers own the nested values they get back.
+    Plain dict rows with nothing to decode (the default summary projection)
+    are returned without copying.
+    """
+
+    decoded = properties if type(properties) is dict else dict(properties)
+    owned = decoded is not properties
+    for key in _JSON_PROPERTIES:
+        raw = decoded.get(key)
+        if isinstance(raw, str) and raw[:1] in ("{", "["):
+            try:
+                parsed = loads_json(raw)
+            except ValueError:
+                continue
+            if not owned:
+                decoded = dict(decoded)
+                owned = True
+            decoded[key] = parsed
+    return decoded
+
+
+def _hybrid_params(
+    group_id: str,
+    query: str,
+    limit: int,
+    source: str | None,
+    text_limit: int,
+) -> dict[str, Any]:
+    if not isinstance(query, str) or not query.strip():
+        raise ValueError("Query must be a non-empty string")
+    if limit <= 0:
+        raise ValueError("Limit must be positive")
+    if text_limit <= 0:
+        raise ValueError("text_limit must be positive")
+    return {
+        "group_id": group_id,
+        "query": _escape_lucene(query.strip()),
+        "needle": query.strip().lower(),
+        "source": source or None,
+        "limit": limit,
+        "text_limit": text_limit,
+    }
+
+
+def _is_missing_index_error(exc: Exception) -> bool:
+    message = str(exc).lower()
+    return EPISODE_TEXT_INDEX in message and ("no such" in message or "not found" in message)
+
+
+def _as_of_params(group_id: str, source: str, native_id: str, as_of: datetime) -> dict[str, Any]:
+    if not source or not native_id:
+        raise ValueError("source and native_id are required")
+    return {
+        "group_id": group_id,
+        "source": source,
+        "native_id": native_id,
+        "as_of": as_of.isoformat(),
+    }
+
+
+def _shortest_path_params(
+    group_id: str,
+    source: str,
+    source_native_id: str,
+    target_native_id: str,
+    max_depth: int,
+) -> dict[str, Any]:
+    if not source_native_id or not target_native_id:
+        raise ValueError("source_native_id and target_native_id are required")
+    if max_depth <= 0:
+        raise ValueError("max_depth must be positive")
+    return {
+        "group_id": group_id,
+        "source": source,
+        "source_native_id": source_native_id,
+        "target_native_id": target_native_id,
+        "max_depth": max_depth,
+    }
 
 
 class GraphitiQueryService:
     """High-level query helpers backed by Neo4j."""
 
     def __init__(self, driver: Any, *, group_id: str) -> None:
+        if driver is None:
+            raise ValueError("A Neo4j driver is required")
         self._driver = driver
         self._group_id = group_id
+        self._fulltext_retry_at = 0.0
 
-    def hybrid_search(self, query: str, *, limit: int = 10) -> list[Mapping[str, Any]]:
-        if not isinstance(query, str) or not query.strip():
-            raise ValueError("Query must be a non-empty string")
-        if limit <= 0:
-            raise ValueError("Limit must be positive")
-        params = {"group_id": self._group_id, "query": query, "limit": limit}
-        with self._driver.session() as session:
-            return session.execute_read(self._query_hybrid, params)
+    def _execute_read(self, work: Callable[..., Any], *args: Any) -> Any:
+        with self._driver.session(default_access_mode=READ_ACCESS) as session:
+            return session.execute_read(work, *args)
+
+    def hybrid_search(
+        self,
+        query: str,
+        *,
+        limit: int = 10,
+        source: str | None = None,
+        text_limit: int = DEFAULT_TEXT_LIMIT,
+        include_metadata: bool = False,
+    ) -> list[Mapping[str, Any]]:
+        """Return matching episodes, newest first, with ``text`` cut to *text_limit* chars.
+
+        ``metadata`` and ``json`` properties are only returned when
+        *include_metadata* is set.
+        """
+
+        params = _hybrid_params(self._group_id, query, limit, source, text_limit)
+        if time.monotonic() >= self._fulltext_retry_at:
+            statement = (
+                _HYBRID_SEARCH_METADATA_CYPHER if include_metadata else _HYBRID_SEARCH_CYPHER
+            )
+            try:
+                return self._execute_read(self._query_nodes, statement, params)
+            except Exception as exc:
+                if not _is_missing_index_error(exc):
+                    raise
+                self._fulltext_retry_at = time.monotonic() + _FULLTEXT_RETRY_SECONDS
+        statement = _HYBRID_SCAN_METADATA_CYPHER if include_metadata else _HYBRID_SCAN_CYPHER
+        return self._execute_read(self._query_nodes, statement, params)
 
     def as_of(
         self,
@@ -28,16 +209,8 @@ class GraphitiQueryService:
         native_id: str,
         as_of: datetime,
     ) -> Mapping[str, Any] | None:
-        if not source or not native_id:
-            raise ValueError("source and native_id are required")
-        params = {
-            "group_id": self._group_id,
-            "source": source,
-            "native_id": native_id,
-            "as_of": as_of.isoformat(),
-        }
-        with self._driver.session() as session:
-            return session.execute_read(self._query_as_of, params)
+        params = _as_of_params(self._group_id, source, native_id, as_of)
+        return self._execute_read(self._query_as_of, params)
 
     def shortest_path(
         self,
@@ -47,47 +220,28 @@ class GraphitiQueryService:
         source: str,
         max_depth: int = 10,
     ) -> list[Mapping[str, Any]]:
-        if not source_native_id or not target_native_id:
-            raise ValueError("source_native_id and target_native_id are required")
-        if max_depth <= 0:
-            raise ValueError("max_depth must be positive")
-        params = {
-            "group_id": self._group_id,
-            "source": source,
-            "source_native_id": source_native_id,
-            "target_native_id": target_native_id,
-            "max_depth": max_depth,
-        }
-        with self._driver.session() as session:
-            return session.execute_read(self._query_shortest_path, params)
+        params = _shortest_path_params(
+            self._group_id, source, source_native_id, target_native_id, max_depth
+        )
+        return self._execute_read(self._query_shortest_path, params)
 
     @staticmethod
-    def _query_hybrid(tx, params):  # pragma: no cover - exercised via driver mocks
-        result = tx.run(
-            """
-            MATCH (e:Episode {group_id: $group_id})
-            WHERE (exists(e.text) AND toLower(e.text) CONTAINS toLower($query))
-            RETURN e ORDER BY e.valid_at DESC LIMIT $limit
-            """,
-            **params,
-        )
-        records: list[Mapping[str, Any]] = []
-        for record in result:
-            node = GraphitiQueryService._first_column(record)
+    def _query_nodes(tx, statement, params):  # pragma: no cover - exercised via driver mocks
+        # Results must be consumed before the managed transaction closes.
+        return list(GraphitiQueryService._iter_nodes(tx.run(statement, params)))
+
+    @staticmethod
+    def _iter_nodes(records: Iterable[Any]) -> Iterator[Mapping[str, Any]]:
+        """Yield the first-column node of each record as a property dict."""
+
+        for record in records:
+            node = GraphitiQueryService._single_column(record)
             if node is not None:
-                records.append(GraphitiQueryService._node_to_dict(node))
-        return records
+                yield GraphitiQueryService._node_to_dict(node)
 
     @staticmethod
     def _query_as_of(tx, params):  # pragma: no cover - exercised via driver mocks
-        record = tx.run(
-            """
-            MATCH (e:Episode {group_id: $group_id, source: $source, native_id: $native_id})
-            WHERE datetime(e.valid_at) <= datetime($as_of)
-            RETURN e ORDER BY e.valid_at DESC LIMIT 1
-            """,
-            **params,
-        ).single()
+        record = tx.run(_AS_OF_CYPHER, params).single()
         if not record:
             return None
         node = GraphitiQueryService._first_column(record)
@@ -95,16 +249,11 @@ class GraphitiQueryService:
 
     @staticmethod
     def _query_shortest_path(tx, params):  # pragma: no cover - exercised via driver mocks
-        result = tx.run(
-            """
-            MATCH (start:Episode {group_id: $group_id, source: $source, native_id: $source_native_id})
-            MATCH (target:Episode {group_id: $group_id, source: $source, native_id: $target_native_id})
-            MATCH p = shortestPath((start)-[*..$max_depth]-(target))
-            RETURN [node IN nodes(p) | node] AS nodes
-            """,
-            **params,
-        )
-        record = result.single()
+        result = tx.run(_SHORTEST_PATH_CYPHER, params)
+        return GraphitiQueryService._path_to_dicts(result.single())
+
+    @staticmethod
+    def _path_to_dicts(record: Any) -> list[Mapping[str, Any]]:
         if not record:
             return []
         nodes = GraphitiQueryService._first_column(record)
@@ -116,12 +265,19 @@ class GraphitiQueryService:
 
     @staticmethod
     def _node_to_dict(node: Any) -> Mapping[str, Any]:
-        if hasattr(node, "_properties"):
-            return dict(node._properties)
-        if isinstance(node, Mapping):
-            return dict(node)
+        properties = getattr(node, "_properties", node)
+        if isinstance(properties, Mapping):
+            return _decode_json_properties(properties)
         return {"value": node}
 
+    @staticmethod
+    def _single_column(record: Any) -> Any:
+        # Driver records are tuples, so single-column queries index directly;
+        # other shapes (mocks, plain mappings) take the generic path.
+        if isinstance(record, tuple):
+            return record[0]
+        return GraphitiQueryService._first_column(record)
+
     @staticmethod
     def _first_column(record: Any) -> Any:
         if isinstance(record, Mapping):
@@ -137,93 +293,133 @@ class GraphitiQueryService:
         return record
 
 
+# JSON schema type name -> (Python type, phrase used in validation errors).
+_SCHEMA_TYPES: Final[Mapping[str, tuple[type, str]]] = {
+    "string": (str, "a string"),
+    "integer": (int, "an integer"),
+    "boolean": (bool, "a boolean"),
+}
+
+
 @dataclass
 class CursorTool:
     name: str
     description: str
     schema: Mapping[str, Any]
     _handler: Callable[..., Mapping[str, Any] | list[Mapping[str, Any]] | None]
+    _required: tuple[str, ...] = field(init=False, repr=False, compare=False)
+    _checks: tuple[tuple[str, type, str], ...] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Flatten the schema once so each call only walks the known fields.
+        self._required = tuple(self.schema.get("required", []))
+        self._checks = tuple(
+            (name, *_SCHEMA_TYPES.get(spec.get("type"), (object, "")))
+            for name, spec in self.schema.get("properties", {}).items()
+        )
 
     def run(self, **kwargs):
         params = self._validate(kwargs)
         return self._handler(**params)
 
     def _validate(self, params: Mapping[str, Any]) -> Mapping[str, Any]:
-        properties = self.schema.get("properties", {})
-        required = self.schema.get("required", [])
         validated: dict[str, Any] = {}
-        for field in required:
-            if field not in params:
-                raise ValueError(f"Missing required parameter: {field}")
-        for field, spec in properties.items():
-            if field not in params:
+        for name in self._required:
+            if name not in params:
+                raise ValueError(f"Missing required parameter: {name}")
+        for name, expected, label in self._checks:
+            if name not in params:
                 continue
-            value = params[field]
-            expected_type = spec.get("type")
-            if expected_type == "string" and not isinstance(value, str):
-                raise ValueError(f"{field} must be a string")
-            if expected_type == "integer" and not isinstance(value, int):
-                raise ValueError(f"{field} must be an integer")
-            validated[field] = value
-        for field in required:
-            validated.setdefault(field, params[field])
+            value = params[name]
+            if not isinstance(value, expected):
+                raise ValueError(f"{name} must be {label}")
+            validated[name] = value
+        for name in self._required:
+            validated.setdefault(name, params[name])
         return validated
 
 
+# Tool schemas never change, so they are built once and shared by every toolset.
+_HYBRID_SEARCH_SCHEMA: Final[Mapping[str, Any]] = {
+    "type": "object",
+    "properties": {
+        "query": {"type": "string"},
+        "limit": {"type": "integer"},
+        "source": {"type": "string"},
+        "include_metadata": {"type": "boolean"},
+    },
+    "required": ["query"],
+}
+
+_AS_OF_SCHEMA: Final[Mapping[str, Any]] = {
+    "type": "object",
+    "properties": {
+        "source": {"type": "string"},
+        "native_id": {"type": "string"},
+        "as_of": {"type": "string"},
+    },
+    "required": ["source", "native_id", "as_of"],
+}
+
+_SHORTEST_PATH_SCHEMA: Final[Mapping[str, Any]] = {
+    "type": "object",
+    "properties": {
+        "source": {"type": "string"},
+        "source_native_id": {"type": "string"},
+        "target_native_id": {"type": "string"},
+        "max_depth": {"type": "integer"},
+    },
+    "required": ["source", "source_native_id", "target_native_id"],
+}
+
+
 class GraphitiCursorToolset:
     """Collection of Cursor tools backed by the query service."""
 
     def __init__(self, query_service: GraphitiQueryService) -> None:
         self._service = query_service
+        self._tools: tuple[CursorTool, ...] | None = None
 
     def tools(self) -> list[CursorTool]:
-        return [
+        # Handlers resolve ``self._service`` per call, so the tools are built
+        # once; a fresh list keeps callers from mutating the cached tuple.
+        if self._tools is None:
+            self._tools = self._build_tools()
+        return list(self._tools)
+
+    def _build_tools(self) -> tuple[CursorTool, ...]:
+        return (
             CursorTool(
                 name="graphiti_hybrid_search",
                 description="Hybrid search across episodes",
-                schema={
-                    "type": "object",
-                    "properties": {
-                        "query": {"type": "string"},
-                        "limit": {"type": "integer"},
-                    },
-                    "required": ["query"],
-                },
+                schema=_HYBRID_SEARCH_SCHEMA,
                 _handler=self._run_hybrid,
             ),
             CursorTool(
                 name="graphiti_as_of",
                 description="Fetch episode as of a timestamp",
-                schema={
-                    "type": "object",
-                    "properties": {
-                        "source": {"type": "string"},
-                        "native_id": {"type": "string"},
-                        "as_of": {"type": "string"},
-                    },
-                    "required": ["source", "native_id", "as_of"],
-                },
+                schema=_AS_OF_SCHEMA,
                 _handler=self._run_as_of,
             ),
             CursorTool(
                 name="graphiti_shortest_path",
                 description="Compute shortest path between two native ids",
-                schema={
-                    "type": "object",
-                    "properties": {
-                        "source": {"type": "string"},
-                        "source_native_id": {"type": "string"},
-                        "target_native_id": {"type": "string"},
-                        "max_depth": {"type": "integer"},
-                    },
-                    "required": ["source", "source_native_id", "target_native_id"],
-                },
+                schema=_SHORTEST_PATH_SCHEMA,
                 _handler=self._run_shortest_path,
             ),
-        ]
+        )
 
-    def _run_hybrid(self, query: str, limit: int = 10, **_: Any):
-        return self._service.hybrid_search(query, limit=limit)
+    def _run_hybrid(
+        self,
+        query: str,
+        limit: int = 10,
+        source: str | None = None,
+        include_metadata: bool = False,
+        **_: Any,
+    ):
+        return self._service.hybrid_search(
+            query, limit=limit, source=source, include_metadata=include_metadata
+        )
 
     def _run_as_of(self, source: str, native_id: str, as_of: str, **_: Any):
         parsed = datetime.fromisoformat(as_of)
@@ -246,6 +442,7 @@ class GraphitiCursorToolset:
 
 
 __all__ = [
+    "DEFAULT_TEXT_LIMIT",
     "GraphitiQueryService",
     "CursorTool",
     "GraphitiCursorToolset",
@@ -3,7 +3,50 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, Dict, Mapping, Optional
+import sys
+from typing import Any, Dict, Final, Iterable, Mapping, Optional, Tuple
+
+EPISODE_TEXT_INDEX = "episode_text"
+EPISODE_ID_INDEX = "episode_id"
+EPISODE_VERSION_INDEX = "episode_native_version"
+# Mirrors ``neo4j.READ_ACCESS`` so read sessions can be routed to replicas
+# without importing the driver here.
+READ_ACCESS = "READ"
+# Episodes per write transaction in ``upsert_episodes``.
+UPSERT_BATCH_SIZE = 256
+
+_WRITE_EPISODE_CYPHER: Final[str] = """
+MERGE (g:Group {group_id: $group_id})
+MERGE (g)-[:HAS_EPISODE]->(e:Episode {episode_id: $episode_id})
+SET e = $properties
+"""
+
+_INVALIDATE_PREVIOUS_CYPHER: Final[str] = """
+MATCH (e:Episode {group_id: $group_id, source: $source, native_id: $native_id})
+WHERE e.episode_id <> $episode_id AND (e.invalid_at IS NULL OR e.invalid_at = "")
+SET e.invalid_at = $valid_at
+"""
+
+# The planner may run every invalidation before any MERGE, so a batch must not
+# hold two versions of one item; ``_upsert_batches`` starts a new transaction
+# whenever an item repeats.
+_UPSERT_BATCH_CYPHER: Final[str] = """
+UNWIND $episodes AS ep
+CALL {
+    WITH ep
+    MATCH (prev:Episode {group_id: ep.group_id, source: ep.source, native_id: ep.native_id})
+    WHERE prev.episode_id <> ep.episode_id AND (prev.invalid_at IS NULL OR prev.invalid_at = "")
+    SET prev.invalid_at = ep.valid_at
+}
+MERGE (g:Group {group_id: ep.group_id})
+MERGE (g)-[:HAS_EPISODE]->(e:Episode {episode_id: ep.episode_id})
+SET e = ep.properties
+"""
+
+_FETCH_LATEST_CYPHER: Final[str] = """
+MATCH (e:Episode {group_id: $group_id, source: $source, native_id: $native_id})
+RETURN e ORDER BY e.valid_at DESC LIMIT 1
+"""
 
 
 @dataclass(slots=True)
@@ -20,10 +63,26 @@ class Episode:
     json: Optional[Mapping[str, Any]] = None
     metadata: Mapping[str, Any] = field(default_factory=dict)
 
+    def __post_init__(self) -> None:
+        # A handful of sources and one group per process: interning keeps a
+        # single copy of each and makes equality checks identity checks.
+        # sys.intern only accepts exact str instances.
+        if type(self.source) is str:
+            self.source = sys.intern(self.source)
+        if type(self.group_id) is str:
+            self.group_id = sys.intern(self.group_id)
+
     def episode_id(self) -> str:
         return f"{self.source}:{self.native_id}:{self.version}"
 
     def to_properties(self) -> Dict[str, Any]:
+        """Node properties for this episode.
+
+        Plain ``dict`` metadata and JSON payloads are passed through as-is
+        (the processor already hands over fresh dicts); other mappings are
+        converted once.
+        """
+
         payload: Dict[str, Any] = {
             "group_id": self.group_id,
             "source": self.source,
@@ -31,17 +90,21 @@ class Episode:
             "version": self.version,
             "episode_id": self.episode_id(),
             "valid_at": self.valid_at.isoformat(),
-            "metadata": dict(self.metadata),
+            "metadata": _as_dict(self.metadata),
         }
         if self.invalid_at:
             payload["invalid_at"] = self.invalid_at.isoformat()
         if self.text is not None:
             payload["text"] = self.text
         if self.json is not None:
-            payload["json"] = dict(self.json)
+            payload["json"] = _as_dict(self.json)
         return payload
 
 
+def _as_dict(value: Mapping[str, Any]) -> Dict[str, Any]:
+    return value if type(value) is dict else dict(value)
+
+
 class Neo4jEpisodeStore:
     """Persistence layer backed by a Neo4j driver."""
 
@@ -61,12 +124,51 @@ class Neo4jEpisodeStore:
             session.execute_write(self._invalidate_previous_version, episode)
             session.execute_write(self._write_episode, episode)
 
+    def upsert_episodes(
+        self, episodes: Iterable[Episode], *, batch_size: int = UPSERT_BATCH_SIZE
+    ) -> int:
+        """Upsert many episodes, ``batch_size`` per write transaction.
+
+        Returns the number of episodes written. Group ids are checked before
+        anything is sent, so a mismatched episode rejects the whole call.
+        """
+
+        rows: list[Dict[str, Any]] = []
+        for episode in episodes:
+            if episode.group_id != self._group_id:
+                raise ValueError(
+                    f"Episode group_id {episode.group_id!r} does not match store group {self._group_id!r}"
+                )
+            properties = episode.to_properties()
+            rows.append(
+                {
+                    "group_id": episode.group_id,
+                    "source": episode.source,
+                    "native_id": episode.native_id,
+                    "episode_id": properties["episode_id"],
+                    "valid_at": properties["valid_at"],
+                    "properties": properties,
+                }
+            )
+        if not rows:
+            return 0
+        with self._driver.session() as session:
+            for batch in _upsert_batches(rows, max(batch_size, 1)):
+                session.execute_write(self._write_episode_batch, batch)
+        return len(rows)
+
     @property
     def group_id(self) -> str:
         return self._group_id
 
-    def fetch_latest_episode_by_native_id(self, source: str, native_id: str) -> Optional[Dict[str, Any]]:
+    def ensure_indexes(self) -> None:
+        """Create the schema indexes used by the query helpers when missing."""
+
         with self._driver.session() as session:
+            session.execute_write(self._create_indexes)
+
+    def fetch_latest_episode_by_native_id(self, source: str, native_id: str) -> Optional[Dict[str, Any]]:
+        with self._driver.session(default_access_mode=READ_ACCESS) as session:
             result = session.execute_read(
                 self._fetch_latest, {
                     "group_id": self._group_id,
@@ -80,23 +182,19 @@ class Neo4jEpisodeStore:
     def _write_episode(tx, episode: Episode) -> None:  # pragma: no cover - executed via driver mocks
         properties = episode.to_properties()
         tx.run(
-            """
-            MERGE (g:Group {group_id: $group_id})
-            MERGE (g)-[:HAS_EPISODE]->(e:Episode {episode_id: $episode_id})
-            SET e = $properties
-            """,
+            _WRITE_EPISODE_CYPHER,
             group_id=episode.group_id,
             episode_id=properties["episode_id"],
             properties=properties,
         )
 
+    @staticmethod
+    def _write_episode_batch(tx, rows: list[Dict[str, Any]]) -> None:  # pragma: no cover - executed via driver mocks
+        tx.run(_UPSERT_BATCH_CYPHER, {"episodes": rows})
+
     def _invalidate_previous_version(self, tx, episode: Episode) -> None:  # pragma: no cover - executed via driver mocks
         tx.run(
-            """
-            MATCH (e:Episode {group_id: $group_id, source: $source, native_id: $native_id})
-            WHERE e.episode_id <> $episode_id AND (e.invalid_at IS NULL OR e.invalid_at = "")
-            SET e.invalid_at = $valid_at
-            """,
+            _INVALIDATE_PREVIOUS_CYPHER,
             group_id=episode.group_id,
             source=episode.source,
             native_id=episode.native_id,
@@ -105,20 +203,70 @@ class Neo4jEpisodeStore:
         )
 
     @staticmethod
-    def _fetch_latest(tx, params: Mapping[str, Any]) -> Optional[Dict[str, Any]]:  # pragma: no cover - executed via driver mocks
-        record = tx.run(
+    def _create_indexes(tx) -> None:  # pragma: no cover - executed via driver mocks
+        tx.run(
+            f"""
+            CREATE FULLTEXT INDEX {EPISODE_TEXT_INDEX} IF NOT EXISTS
+            FOR (e:Episode) ON EACH [e.text]
+            """
+        )
+        tx.run(
+            f"""
+            CREATE INDEX {EPISODE_ID_INDEX} IF NOT EXISTS
+            FOR (e:Episode) ON (e.episode_id)
+            """
+        )
+        # Equality on the native id prefix plus valid_at last lets the planner
+        # serve "latest version" lookups from the index without sorting.
+        tx.run(
+            f"""
+            CREATE INDEX {EPISODE_VERSION_INDEX} IF NOT EXISTS
+            FOR (e:Episode) ON (e.group_id, e.source, e.native_id, e.valid_at)
             """
-            MATCH (e:Episode {group_id: $group_id, source: $source, native_id: $native_id})
-            RETURN e ORDER BY e.valid_at DESC LIMIT 1
-            """,
-            **params,
-        ).single()
+        )
+
+    @staticmethod
+    def _fetch_latest(tx, params: Mapping[str, Any]) -> Optional[Dict[str, Any]]:  # pragma: no cover - executed via driver mocks
+        record = tx.run(_FETCH_LATEST_CYPHER, params).single()
         if not record:
             return None
-        node = record[0]
-        if hasattr(node, "_properties"):
-            return dict(node._properties)
-        return dict(node)
+        return _node_properties(record[0])
+
+
+def _upsert_batches(
+    rows: list[Dict[str, Any]], size: int
+) -> Iterable[list[Dict[str, Any]]]:
+    """Split rows into write batches with each item at most once per batch.
+
+    Later versions of an item land in a later transaction, so they invalidate
+    the earlier ones in order, as successive ``upsert_episode`` calls would.
+    """
+
+    batch: list[Dict[str, Any]] = []
+    keys: set[Tuple[str, str]] = set()
+    for row in rows:
+        key = (row["source"], row["native_id"])
+        if len(batch) >= size or key in keys:
+            yield batch
+            batch, keys = [], set()
+        batch.append(row)
+        keys.add(key)
+    if batch:
+        yield batch
+
+
+def _node_properties(node: Any) -> Dict[str, Any]:
+    if hasattr(node, "_properties"):
+        return dict(node._properties)
+    return dict(node)
 
 
-__all__ = ["Episode", "Neo4jEpisodeStore"]
+__all__ = [
+    "READ_ACCESS",
+    "UPSERT_BATCH_SIZE",
+    "EPISODE_ID_INDEX",
+    "EPISODE_TEXT_INDEX",
+    "EPISODE_VERSION_INDEX",
+    "Episode",
+    "Neo4jEpisodeStore",
+]
@@ -1,6 +1,7 @@
 """End-to-end acceptance test harness utilities."""
 from __future__ import annotations
 
+from bisect import bisect_right
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
 from typing import Iterable, Mapping, MutableMapping, Sequence
@@ -96,6 +97,12 @@ class AcceptanceTestHarness:
 @dataclass
 class _HarnessGmailClient:
     messages: Sequence[Mapping[str, object]]
+    _by_id: dict[str, Mapping[str, object]] = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self._by_id = {}
+        for message in self.messages:
+            self._by_id.setdefault(str(message.get("id")), message)
 
     def list_history(self, start_history_id: str | None) -> GmailHistoryResult:
         message_ids = [str(message.get("id")) for message in self.messages if message.get("id")]
@@ -106,10 +113,10 @@ class _HarnessGmailClient:
         return self.list_history(None)
 
     def fetch_message(self, message_id: str) -> Mapping[str, object]:
-        for message in self.messages:
-            if str(message.get("id")) == message_id:
-                return dict(message)
-        raise KeyError(f"Message {message_id} not found")
+        message = self._by_id.get(message_id)
+        if message is None:
+            raise KeyError(f"Message {message_id} not found")
+        return dict(message)
 
 
 @dataclass
@@ -144,6 +151,22 @@ class _HarnessSlackClient:
     channels: Sequence[Mapping[str, object]]
     messages: Mapping[str, Sequence[Mapping[str, object]]]
     threads: Mapping[str, Mapping[str, Sequence[Mapping[str, object]]]]
+    # Every channel message in timestamp order, with the parsed timestamps kept
+    # alongside so searches can bisect on ``oldest``.
+    _timeline: list[Mapping[str, object]] = field(init=False, repr=False)
+    _timeline_ts: list[float] = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        entries: list[tuple[float, Mapping[str, object]]] = []
+        for channel in self.channels:
+            channel_id = str(channel.get("id"))
+            for message in self.messages.get(channel_id, ()):  # type: ignore[arg-type]
+                enriched = dict(message)
+                enriched.setdefault("channel", {"id": channel_id, "name": channel.get("name")})
+                entries.append((float(str(enriched.get("ts", "0"))), enriched))
+        entries.sort(key=lambda entry: entry[0])
+        self._timeline_ts = [ts for ts, _ in entries]
+        self._timeline = [message for _, message in entries]
 
     def list_channels(self) -> Iterable[Mapping[str, object]]:
         return list(self.channels)
@@ -159,21 +182,8 @@ class _HarnessSlackClient:
             oldest_value = float(oldest) if oldest else None
         except ValueError:
             oldest_value = None
-        results: list[Mapping[str, object]] = []
-        for channel in self.channels:
-            channel_id = str(channel.get("id"))
-            for message in self.messages.get(channel_id, ()):  # type: ignore[arg-type]
-                ts = str(message.get("ts", ""))
-                if oldest_value is not None:
-                    try:
-                        if float(ts) <= oldest_value:
-                            continue
-                    except ValueError:
-                        pass
-                enriched = dict(message)
-                enriched.setdefault("channel", {"id": channel_id, "name": channel.get("name")})
-                results.append(enriched)
-        results.sort(key=lambda item: float(str(item.get("ts", "0"))), reverse=False)
+        start = 0 if oldest_value is None else bisect_right(self._timeline_ts, oldest_value)
+        results = [dict(message) for message in self._timeline[start:]]
         return {"messages": results, "next_cursor": None}
 
     def fetch_message(self, channel_id: str, ts: str) -> Mapping[str, object]:
@@ -208,15 +218,17 @@ def build_fixture_dataset(start: datetime | None = None) -> AcceptanceDataset:
     """Construct a default dataset covering 14 days of activity."""
 
     base = start or datetime.now(timezone.utc)
+    # Day offsets are computed once and shared by the Gmail and Drive fixtures.
+    days = [base - timedelta(days=idx) for idx in range(3)]
     gmail_messages = [
         {
             "id": f"email-{idx}",
             "threadId": f"thread-{idx}",
             "historyId": str(idx + 1),
-            "internalDate": str(int((base - timedelta(days=idx)).timestamp() * 1000)),
+            "internalDate": str(int(day.timestamp() * 1000)),
             "snippet": f"Email body {idx}",
         }
-        for idx in range(3)
+        for idx, day in enumerate(days)
     ]
 
     drive_changes = [
@@ -225,11 +237,11 @@ def build_fixture_dataset(start: datetime | None = None) -> AcceptanceDataset:
             "file": {
                 "name": f"Doc {idx}",
                 "mimeType": "text/plain",
-                "modifiedTime": (base - timedelta(days=idx)).isoformat(),
+                "modifiedTime": day.isoformat(),
                 "content": f"Document content {idx}",
             },
         }
-        for idx in range(2)
+        for idx, day in enumerate(days[:2])
     ]
 
     calendar_events = {
@@ -2,14 +2,22 @@
 from __future__ import annotations
 
 from datetime import datetime, timedelta, timezone
-import json
+from functools import lru_cache
+import threading
+import time
 from typing import Any, Mapping
 
 from .config import GraphitiConfig, load_config
 from .state import GraphitiStateStore
+from .utils import dumps_json
 
 SOURCE_ORDER = ("gmail", "drive", "calendar", "slack", "mcp")
 
+_HEALTH_PATHS = frozenset({"/health", "/health/"})
+_HEALTH_METHODS = frozenset({"GET", "HEAD"})
+_Headers = tuple[tuple[str, str], ...]
+_NOT_FOUND_HEADERS: _Headers = (("Content-Type", "application/json"), ("Content-Length", "0"))
+
 
 def collect_health_metrics(
     state_store: GraphitiStateStore,
@@ -78,6 +86,10 @@ def format_dashboard(metrics: Mapping[str, Any]) -> str:
     header = "Personal Assistant Sync Status"
     if isinstance(generated, str):
         header += f" — {generated}"
+    # collect_health_metrics only reports "pending" overall when no source has
+    # run yet, which is every fresh install; there is no table worth drawing.
+    if metrics.get("status") == "pending":
+        return f"{header}\n\nNo sources have run yet.\n\nOverall status: PENDING"
     lines = [header, ""]
     lines.append(
         f"{'Source':<10} {'Last Run (UTC)':<22} {'Status':<8} {'Errors':<8} {'Next Due':<22}"
@@ -87,7 +99,7 @@ def format_dashboard(metrics: Mapping[str, Any]) -> str:
     if not isinstance(sources, Mapping):
         sources = {}
     for source in SOURCE_ORDER:
-        info = sources.get(source, {}) if isinstance(sources, Mapping) else {}
+        info = sources.get(source, {})
         if not isinstance(info, Mapping):
             info = {}
         last_run = _format_timestamp(info.get("last_run_at"))
@@ -103,7 +115,12 @@ def format_dashboard(metrics: Mapping[str, Any]) -> str:
 
 
 class HealthApp:
-    """Minimal WSGI-compatible health endpoint."""
+    """Minimal WSGI-compatible health endpoint.
+
+    The rendered body is cached for a quarter of the shortest poll interval.
+    Once that expires the stale body is still served, for up to twice as long
+    again, while a background thread renders a fresh one.
+    """
 
     def __init__(
         self,
@@ -111,33 +128,68 @@ class HealthApp:
         config: GraphitiConfig | None = None,
         state_store: GraphitiStateStore | None = None,
     ) -> None:
-        self._config = config or load_config()
+        # Without an explicit config, load it per request: startup stays free of
+        # file I/O and edits to config.json are picked up. load_config only
+        # re-parses when the files change.
+        self._config = config
         self._state = state_store or GraphitiStateStore()
+        self._cache: tuple[float, float, bytes, Mapping[str, _Headers]] | None = None
+        self._refresh_lock = threading.Lock()
+
+    @property
+    def config(self) -> GraphitiConfig:
+        return self._config or load_config()
 
     def __call__(self, environ, start_response):  # pragma: no cover - exercised in tests
-        method = environ.get("REQUEST_METHOD", "GET").upper()
-        path = environ.get("PATH_INFO", "")
-        if path.rstrip("/") == "/health" and method in {"GET", "HEAD"}:
-            payload = collect_health_metrics(self._state, self._config)
-            body = json.dumps(payload, indent=2, sort_keys=True).encode("utf-8")
-            length = len(body) if method == "GET" else 0
-            start_response(
-                "200 OK",
-                [
-                    ("Content-Type", "application/json"),
-                    ("Content-Length", str(length)),
-                ],
-            )
+        method = environ.get("REQUEST_METHOD", "GET")
+        if environ.get("PATH_INFO", "") in _HEALTH_PATHS and method in _HEALTH_METHODS:
+            body, headers = self._response()
+            # Servers may append to the header list, so each request gets a copy.
+            start_response("200 OK", list(headers[method]))
             if method == "HEAD":
                 return [b""]
             return [body]
 
-        start_response(
-            "404 Not Found",
-            [("Content-Type", "application/json"), ("Content-Length", "0")],
-        )
+        start_response("404 Not Found", list(_NOT_FOUND_HEADERS))
         return [b""]
 
+    def _response(self) -> tuple[bytes, Mapping[str, _Headers]]:
+        cached = self._cache
+        if cached is not None:
+            expires_at, ttl, body, headers = cached
+            now = time.monotonic()
+            if now < expires_at:
+                return body, headers
+            if now < expires_at + ttl * 2:
+                if self._refresh_lock.acquire(blocking=False):
+                    threading.Thread(target=self._revalidate, daemon=True).start()
+                return body, headers
+        with self._refresh_lock:
+            return self._render()
+
+    def _revalidate(self) -> None:
+        try:
+            self._render()
+        finally:
+            self._refresh_lock.release()
+
+    def _render(self) -> tuple[bytes, Mapping[str, _Headers]]:
+        config = self.config
+        payload = collect_health_metrics(self._state, config)
+        body = dumps_json(payload, indent=True, sort_keys=True).encode("utf-8")
+        ttl = _cache_ttl(config)
+        cache_control = ("Cache-Control", f"max-age={int(ttl)}, stale-while-revalidate={int(ttl * 2)}")
+        headers = {
+            method: (
+                ("Content-Type", "application/json"),
+                ("Content-Length", str(len(body) if method == "GET" else 0)),
+                cache_control,
+            )
+            for method in _HEALTH_METHODS
+        }
+        self._cache = (time.monotonic() + ttl, ttl, body, headers)
+        return body, headers
+
 
 def create_health_app(
     *,
@@ -151,12 +203,11 @@ def create_health_app(
 
         app = FastAPI()
 
-        resolved_config = config or load_config()
         resolved_state = state_store or GraphitiStateStore()
 
         @app.get("/health")
         def _health_endpoint():
-            return collect_health_metrics(resolved_state, resolved_config)
+            return collect_health_metrics(resolved_state, config or load_config())
 
         return app
     except Exception:
@@ -173,21 +224,37 @@ def _poll_interval_for_source(
     return None
 
 
+def _cache_ttl(config: GraphitiConfig) -> float:
+    shortest = min(config.poll_gmail_drive_calendar_seconds, config.poll_slack_active_seconds)
+    return max(shortest, 1) / 4
+
+
 def _parse_time(value: Any) -> datetime | None:
     if isinstance(value, datetime):
         return value.astimezone(timezone.utc)
     if isinstance(value, str) and value:
-        try:
-            cleaned = value
-            if cleaned.endswith("Z"):
-                cleaned = cleaned[:-1] + "+00:00"
-            return datetime.fromisoformat(cleaned).astimezone(timezone.utc)
-        except ValueError:
-            return None
+        return _parse_iso(value)
     return None
 
 
+# State timestamps only change when a poller runs, so the same strings are
+# parsed on every health request in between.
+@lru_cache(maxsize=4096)
+def _parse_iso(value: str) -> datetime | None:
+    try:
+        cleaned = value
+        if cleaned.endswith("Z"):
+            cleaned = cleaned[:-1] + "+00:00"
+        return datetime.fromisoformat(cleaned).astimezone(timezone.utc)
+    except ValueError:
+        return None
+
+
 def _format_timestamp(value: Any) -> str:
+    # collect_health_metrics emits UTC ISO strings; slice those rather than
+    # parsing them a second time.
+    if isinstance(value, str) and len(value) >= 25 and value[10] == "T" and value.endswith("+00:00"):
+        return f"{value[:10]} {value[11:19]}"
     dt = _parse_time(value)
     if dt is None:
         return "never"
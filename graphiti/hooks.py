@@ -3,6 +3,8 @@ from __future__ import annotations
 
 from dataclasses import dataclass, replace
 from datetime import datetime, timezone
+from functools import lru_cache
+import json
 import re
 from typing import Any, Mapping, MutableMapping, Sequence
 
@@ -32,11 +34,44 @@ class RedactionRule:
         return updated, count
 
 
+# Leading global flags such as ``(?i)`` cannot appear mid-pattern, so they
+# are re-expressed as scoped flags when rules are combined.
+_LEADING_FLAGS = re.compile(r"^\(\?[aiLmsux]+\)")
+_SCOPED_FLAGS = ((re.ASCII, "a"), (re.IGNORECASE, "i"), (re.MULTILINE, "m"), (re.DOTALL, "s"), (re.VERBOSE, "x"))
+_NUMBERED_BACKREF = re.compile(r"\\[1-9]|\\g<\d")
+
+
+def _combine_rules(rules: Sequence[RedactionRule]) -> re.Pattern[str] | None:
+    """Compile one alternation matching wherever any rule matches.
+
+    Returns ``None`` when there is nothing to gain (a single rule) or the
+    patterns cannot be merged safely, e.g. numbered backreferences that would
+    point at another rule's groups.
+    """
+
+    if len(rules) < 2:
+        return None
+    parts: list[str] = []
+    for rule in rules:
+        source = rule.pattern.pattern
+        if not isinstance(source, str) or _NUMBERED_BACKREF.search(source):
+            return None
+        flags = "".join(letter for flag, letter in _SCOPED_FLAGS if rule.pattern.flags & flag)
+        parts.append(f"(?{flags}:{_LEADING_FLAGS.sub('', source)})")
+    try:
+        return re.compile("|".join(parts))
+    except re.error:
+        return None
+
+
 class RedactionPipeline:
     """Apply a list of redaction rules across nested payloads."""
 
     def __init__(self, rules: Sequence[RedactionRule] | None = None) -> None:
         self._rules: tuple[RedactionRule, ...] = tuple(rules or ())
+        # Most values contain nothing to redact; one scan with the combined
+        # pattern proves that before paying for a pass per rule.
+        self._combined = _combine_rules(self._rules)
 
     def enabled(self) -> bool:
         return bool(self._rules)
@@ -44,6 +79,8 @@ class RedactionPipeline:
     def apply_text(self, value: str | None) -> tuple[str | None, MutableMapping[str, int]]:
         if value is None:
             return None, {}
+        if self._combined is not None and self._combined.search(value) is None:
+            return value, {}
         total: dict[str, int] = {}
         redacted = value
         for rule in self._rules:
@@ -53,28 +90,89 @@ class RedactionPipeline:
         return redacted, total
 
     def apply_structure(
-        self, payload: Any
+        self, payload: Any, *, in_place: bool = False
     ) -> tuple[Any, MutableMapping[str, int]]:
+        """Redact every string in *payload*, returning the result and rule counts.
+
+        Containers are only rebuilt when something inside them changed, so an
+        untouched subtree comes back as the very same object. With
+        ``in_place=True`` a root ``dict`` or ``list`` the caller owns is
+        updated directly; nested containers are never mutated.
+        """
+
         stats: dict[str, int] = {}
 
-        def _apply(value: Any) -> Any:
-            nonlocal stats
-            if isinstance(value, str):
-                updated, counts = self.apply_text(value)
-                for key, count in counts.items():
-                    stats[key] = stats.get(key, 0) + count
-                return updated
-            if isinstance(value, Mapping):
-                return {key: _apply(val) for key, val in value.items()}
-            if isinstance(value, list):
-                return [_apply(item) for item in value]
-            if isinstance(value, tuple):  # preserve tuple semantics
-                return tuple(_apply(item) for item in value)
-            if isinstance(value, set):
-                return {_apply(item) for item in value}
-            return value
-
-        return _apply(payload), stats
+        def _scan(value: Any) -> Any:
+            if not isinstance(value, str):
+                return value
+            updated, counts = self.apply_text(value)
+            for key, count in counts.items():
+                stats[key] = stats.get(key, 0) + count
+            return updated
+
+        if not isinstance(payload, _NESTED_TYPES):
+            return _scan(payload), stats
+
+        # Depth-first walk with an explicit stack; each frame collects its
+        # children's results and is rebuilt (if needed) once they are done.
+        stack = [_StructureFrame.of(payload)]
+        while True:
+            frame = stack[-1]
+            if frame.position < len(frame.values):
+                child = frame.values[frame.position]
+                frame.position += 1
+                if isinstance(child, _NESTED_TYPES):
+                    stack.append(_StructureFrame.of(child))
+                    continue
+                frame.add(child, _scan(child))
+                continue
+            stack.pop()
+            built = frame.build(in_place=in_place and not stack)
+            if not stack:
+                return built, stats
+            stack[-1].add(frame.node, built)
+
+
+_NESTED_TYPES = (Mapping, list, tuple, set)
+
+
+@dataclass(slots=True)
+class _StructureFrame:
+    node: Any
+    keys: list[Any] | None
+    values: list[Any]
+    results: list[Any]
+    position: int = 0
+    changed: bool = False
+
+    @classmethod
+    def of(cls, node: Any) -> "_StructureFrame":
+        if isinstance(node, Mapping):
+            return cls(node, list(node.keys()), list(node.values()), [])
+        return cls(node, None, list(node), [])
+
+    def add(self, original: Any, updated: Any) -> None:
+        self.results.append(updated)
+        if updated is not original:
+            self.changed = True
+
+    def build(self, *, in_place: bool) -> Any:
+        node = self.node
+        if not self.changed:
+            return node
+        if self.keys is not None:
+            if in_place and type(node) is dict:
+                node.update(zip(self.keys, self.results))
+                return node
+            return dict(zip(self.keys, self.results))
+        if isinstance(node, list):
+            if in_place and type(node) is list:
+                node[:] = self.results
+                return node
+            return self.results
+        if isinstance(node, tuple):  # preserve tuple semantics
+            return tuple(self.results)
+        return set(self.results)
 
 
 @dataclass(frozen=True)
@@ -106,8 +204,7 @@ class HeuristicSummarizer:
         normalised = text.strip()
         if original_length <= self._threshold or not normalised:
             return None
-        sentences = _split_sentences(normalised)
-        chosen = sentences[: self._sentence_count]
+        chosen = _leading_sentences(normalised, self._sentence_count)
         if not chosen:
             chosen = [normalised[: self._max_chars]]
         summary = " ".join(chosen).strip()
@@ -121,10 +218,27 @@ class HeuristicSummarizer:
         )
 
 
-def _split_sentences(text: str) -> list[str]:
-    pattern = re.compile(r"(?<=[.!?])\s+")
-    parts = pattern.split(text)
-    return [part.strip() for part in parts if part.strip()]
+_SENTENCE_BREAK = re.compile(r"(?<=[.!?])\s+")
+
+
+def _leading_sentences(text: str, count: int) -> list[str]:
+    """Return up to *count* non-empty sentences from the start of *text*.
+
+    Scanning stops as soon as enough sentences are found, so long bodies are
+    not split in full just to keep the first few.
+    """
+
+    sentences: list[str] = []
+    start = 0
+    for match in _SENTENCE_BREAK.finditer(text):
+        if part := text[start : match.start()].strip():
+            sentences.append(part)
+            if len(sentences) >= count:
+                return sentences
+        start = match.end()
+    if tail := text[start:].strip():
+        sentences.append(tail)
+    return sentences
 
 
 def _truncate(text: str, limit: int) -> str:
@@ -153,12 +267,16 @@ class EpisodeProcessor:
         )
 
         text = episode.text
-        json_payload = dict(episode.json) if isinstance(episode.json, Mapping) else episode.json
+        owns_json = isinstance(episode.json, Mapping)
+        json_payload = dict(episode.json) if owns_json else episode.json
 
         if self._redactor and self._redactor.enabled():
             text, text_counts = self._redactor.apply_text(text)
-            json_payload, json_counts = self._redactor.apply_structure(json_payload)
-            metadata, meta_counts = self._redactor.apply_structure(metadata)
+            # Both top-level dicts were copied above, so they can be updated in place.
+            json_payload, json_counts = self._redactor.apply_structure(
+                json_payload, in_place=owns_json
+            )
+            metadata, meta_counts = self._redactor.apply_structure(metadata, in_place=True)
             aggregated = _merge_counts(text_counts, json_counts, meta_counts)
             if aggregated:
                 processing_meta["redactions"] = {
@@ -183,18 +301,7 @@ class EpisodeProcessor:
         return replace(episode, text=text, json=json_payload, metadata=dict(metadata))
 
     def _build_redactor(self, config: GraphitiConfig) -> RedactionPipeline | None:
-        rules: list[RedactionRule] = []
-        for pattern, replacement in config.redaction_rules:
-            try:
-                rules.append(
-                    RedactionRule.from_pattern(
-                        pattern,
-                        replacement or "[REDACTED]",
-                        name=pattern,
-                    )
-                )
-            except re.error:
-                continue
+        rules: list[RedactionRule] = list(_compile_config_rules(config.redaction_rules))
         if config.redaction_rules_path:
             rules.extend(_load_rules_from_path(config.redaction_rules_path))
         if not rules:
@@ -213,6 +320,31 @@ class EpisodeProcessor:
         )
 
 
+@lru_cache(maxsize=32)
+def _compile_config_rules(
+    redaction_rules: tuple[tuple[str, str], ...]
+) -> tuple[RedactionRule, ...]:
+    """Compile inline config rules once per distinct rule set.
+
+    Every poller and the MCP logger build their own processor from the same
+    config, so they share the compiled patterns. Invalid patterns are skipped.
+    """
+
+    rules: list[RedactionRule] = []
+    for pattern, replacement in redaction_rules:
+        try:
+            rules.append(
+                RedactionRule.from_pattern(
+                    pattern,
+                    replacement or "[REDACTED]",
+                    name=pattern,
+                )
+            )
+        except re.error:
+            continue
+    return tuple(rules)
+
+
 def _load_rules_from_path(path: str) -> list[RedactionRule]:
     rules: list[RedactionRule] = []
     try:
@@ -241,8 +373,6 @@ def _load_rules_from_path(path: str) -> list[RedactionRule]:
 
 def _parse_rule_document(content: str) -> list[Mapping[str, str]]:
     try:
-        import json
-
         data = json.loads(content)
     except Exception:
         data = _parse_simple_yaml(content)
@@ -6,7 +6,17 @@ from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from threading import Lock
 from typing import Any, Mapping
-import json
+import os
+import re
+
+from .utils import dumps_json, loads_json
+
+# Read size when scanning backwards from the end of a log for ``tail``.
+_TAIL_CHUNK = 64 * 1024
+
+# Records are written with sorted keys, so ``timestamp`` is the last top-level
+# field and can be read off the end of the line without decoding the JSON.
+_TRAILING_TIMESTAMP = re.compile(rb'"timestamp":\s*"([^"\\]+)"\s*\}\s*$')
 
 
 @dataclass(frozen=True)
@@ -68,11 +78,11 @@ class GraphitiLogStore:
         )
         path = self._path_for_category(category)
         payload = record.to_json()
-        line = json.dumps(payload, sort_keys=True)
+        line = (dumps_json(payload, sort_keys=True) + "\n").encode("utf-8")
         with self._lock:
             path.parent.mkdir(parents=True, exist_ok=True)
-            with path.open("a", encoding="utf-8") as handle:
-                handle.write(line + "\n")
+            with path.open("ab") as handle:
+                handle.write(line)
             if retention_days is not None:
                 self._prune_file(path, retention_days)
         return record
@@ -85,15 +95,16 @@ class GraphitiLogStore:
         since: datetime | None = None,
     ) -> list[LogRecord]:
         path = self._path_for_category(category)
-        if not path.exists():
+        try:
+            lines = _read_last_lines(path, limit)
+        except FileNotFoundError:
             return []
-        lines = path.read_text(encoding="utf-8").splitlines()[-max(limit, 0) :]
         records: list[LogRecord] = []
         for line in lines:
             if not line.strip():
                 continue
             try:
-                payload = json.loads(line)
+                payload = loads_json(line)
                 record = LogRecord.from_json(payload)
             except Exception:  # pragma: no cover - defensive parsing
                 continue
@@ -130,24 +141,71 @@ class GraphitiLogStore:
         if retention_days == 0:
             path.unlink(missing_ok=True)
             return
-        if not path.exists():
+        tmp_path = path.with_suffix(".tmp")
+        changed = False
+        try:
+            with path.open("rb") as source, tmp_path.open("wb") as target:
+                for line in source:
+                    timestamp = _line_timestamp(line) if line.strip() else None
+                    if timestamp is None or timestamp < cutoff_dt:
+                        changed = True
+                        continue
+                    if not line.endswith(b"\n"):
+                        line += b"\n"
+                        changed = True
+                    target.write(line)
+        except FileNotFoundError:
+            tmp_path.unlink(missing_ok=True)
             return
-        lines = path.read_text(encoding="utf-8").splitlines()
-        kept: list[str] = []
-        for line in lines:
-            if not line.strip():
-                continue
-            try:
-                payload = json.loads(line)
-                record = LogRecord.from_json(payload)
-            except Exception:  # pragma: no cover - defensive
-                continue
-            if record.timestamp >= cutoff_dt:
-                kept.append(json.dumps(record.to_json(), sort_keys=True))
-        with path.open("w", encoding="utf-8") as handle:
-            handle.write("\n".join(kept))
-            if kept:
-                handle.write("\n")
+        # Nothing expired (the usual case when called on every append): keep
+        # the original file rather than swapping in an identical copy.
+        if changed:
+            os.replace(tmp_path, path)
+        else:
+            tmp_path.unlink()
+
+
+def _line_timestamp(line: bytes) -> datetime | None:
+    match = _TRAILING_TIMESTAMP.search(line)
+    if match is not None:
+        raw = match.group(1).decode("ascii", "replace")
+        try:
+            timestamp = datetime.fromisoformat(raw[:-1] + "+00:00" if raw.endswith("Z") else raw)
+        except ValueError:
+            return None
+        return timestamp if timestamp.tzinfo is not None else timestamp.astimezone(timezone.utc)
+    # Lines from other writers may order keys differently.
+    try:
+        return LogRecord.from_json(loads_json(line)).timestamp
+    except Exception:  # pragma: no cover - defensive
+        return None
+
+
+def _read_last_lines(path: Path, limit: int) -> list[bytes]:
+    """Return the last *limit* lines of *path* (every line when ``limit <= 0``).
+
+    The file is read backwards in chunks until enough newlines are seen, so
+    the cost depends on *limit* rather than on the size of the log.
+    """
+
+    with path.open("rb") as handle:
+        if limit <= 0:
+            return handle.read().splitlines()
+        position = handle.seek(0, os.SEEK_END)
+        chunks: list[bytes] = []
+        newlines = 0
+        while position > 0 and newlines <= limit:
+            size = min(_TAIL_CHUNK, position)
+            position -= size
+            handle.seek(position)
+            chunk = handle.read(size)
+            chunks.append(chunk)
+            newlines += chunk.count(b"\n")
+    lines = b"".join(reversed(chunks)).splitlines()
+    if position > 0:
+        # Started mid-file, so the first line is probably partial.
+        lines = lines[1:]
+    return lines[-limit:]
 
 
 __all__ = ["GraphitiLogStore", "LogRecord"]
@@ -4,12 +4,15 @@ from __future__ import annotations
 from collections import deque
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
+import logging
 from threading import Lock
 from typing import Deque, Mapping, MutableMapping
 
 from ..config import GraphitiConfig, load_config
 from ..episodes import Episode, Neo4jEpisodeStore
 
+_LOGGER = logging.getLogger(__name__)
+
 
 @dataclass(slots=True)
 class McpTurn:
@@ -23,28 +26,32 @@ class McpTurn:
     metadata: Mapping[str, object] = field(default_factory=dict)
 
     def to_episode(self, group_id: str) -> Episode:
-        metadata = dict(self.metadata)
-        metadata.update({
+        # One snapshot of the caller's metadata serves both the structured
+        # payload and the merged episode metadata.
+        snapshot = dict(self.metadata)
+        metadata = {
+            **snapshot,
             "conversation_id": self.conversation_id,
             "thread_id": self.conversation_id,
             "role": self.role,
-        })
+        }
+        timestamp = self.timestamp.isoformat()
         json_payload: MutableMapping[str, object] = {
             "message_id": self.message_id,
             "conversation_id": self.conversation_id,
             "thread_id": self.conversation_id,
             "role": self.role,
-            "timestamp": self.timestamp.isoformat(),
+            "timestamp": timestamp,
         }
         if self.content is not None:
             json_payload["content"] = self.content
-        if self.metadata:
-            json_payload["metadata"] = dict(self.metadata)
+        if snapshot:
+            json_payload["metadata"] = snapshot
         return Episode(
             group_id=group_id,
             source="mcp",
             native_id=self.message_id,
-            version=self.timestamp.isoformat(),
+            version=timestamp,
             valid_at=self.timestamp.astimezone(timezone.utc),
             text=self.content,
             json=json_payload,
@@ -64,23 +71,36 @@ class McpEpisodeLogger:
         self._config = self.config or load_config()
         if self.episode_store.group_id != self._config.group_id:
             raise ValueError("Episode store group_id does not match configuration group_id")
-        self._queue: Deque[McpTurn] = deque()
+        # Bounded: once full, appending a new turn drops the oldest one.
+        # deque.append/popleft are atomic, so producers never take a lock;
+        # ``_lock`` only serialises the consumer side (drain and requeue).
+        # Failed turns wait in ``_retry`` rather than going back into the
+        # deque, where appendleft on a full queue would evict the newest turn.
+        self._queue: Deque[McpTurn] = deque(maxlen=self.queue_limit)
+        self._retry: list[McpTurn] = []
         self._lock = Lock()
 
     def log_turn(self, turn: McpTurn) -> None:
         """Queue a turn for persistence."""
 
-        with self._lock:
-            if len(self._queue) >= self.queue_limit:
-                self._queue.popleft()
-            self._queue.append(turn)
+        self._queue.append(turn)
 
     def drain(self) -> list[McpTurn]:
         """Drain the queue and return the collected turns."""
 
         with self._lock:
-            items = list(self._queue)
-            self._queue.clear()
+            items, self._retry = self._retry, []
+            # Pop rather than copy-and-clear so a turn appended concurrently
+            # is either drained now or left for the next flush, never lost.
+            popleft = self._queue.popleft
+            try:
+                while True:
+                    items.append(popleft())
+            except IndexError:
+                pass
+        # Retried turns are older than anything still queued, so trimming the
+        # front keeps the queue's drop-oldest policy across both.
+        del items[: -self.queue_limit]
         return items
 
     def flush(self) -> int:
@@ -89,27 +109,47 @@ class McpEpisodeLogger:
         turns = self.drain()
         if not turns:
             return 0
+        group_id = self._config.group_id
+        episodes = [turn.to_episode(group_id) for turn in turns]
+        upsert_many = getattr(self.episode_store, "upsert_episodes", None)
+        if callable(upsert_many):
+            try:
+                upsert_many(episodes)
+                return len(episodes)
+            except ValueError:
+                # Group validation rejects the whole batch before writing, and
+                # would reject every turn again; keep the turns and surface it.
+                self._requeue(turns)
+                raise
+            except Exception:
+                # Retry one at a time so a single bad turn cannot hold back the
+                # rest; upserts are idempotent, so re-writing any part of the
+                # batch that did land is harmless.
+                _LOGGER.warning(
+                    "Batched MCP upsert failed; retrying turns one at a time",
+                    exc_info=True,
+                )
         processed = 0
         failures: list[tuple[McpTurn, Exception]] = []
-        for turn in turns:
-            episode = turn.to_episode(self._config.group_id)
+        for turn, episode in zip(turns, episodes):
             try:
                 self.episode_store.upsert_episode(episode)
                 processed += 1
             except Exception as exc:  # pragma: no cover - defensive
                 failures.append((turn, exc))
         if failures:
-            with self._lock:
-                for turn, _ in reversed(failures):
-                    if len(self._queue) < self.queue_limit:
-                        self._queue.appendleft(turn)
+            self._requeue([turn for turn, _ in failures])
             first_error = failures[0][1]
             raise RuntimeError("Failed to persist MCP turns") from first_error
         return processed
 
-    def pending(self) -> int:
+    def _requeue(self, turns: list[McpTurn]) -> None:
         with self._lock:
-            return len(self._queue)
+            self._retry[:0] = turns
+            del self._retry[: -self.queue_limit]
+
+    def pending(self) -> int:
+        return len(self._retry) + len(self._queue)
 
 
 __all__ = ["McpTurn", "McpEpisodeLogger"]
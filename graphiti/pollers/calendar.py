@@ -12,6 +12,16 @@ from ..state import GraphitiStateStore
 from ..utils import sleep_with_jitter
 
 
+# ``fields`` mask for every ``events().list`` page, including the pages of a
+# full sync. It keeps the attributes stored on calendar episodes plus the
+# paging tokens.
+CALENDAR_EVENT_FIELDS = (
+    "nextPageToken,nextSyncToken,"
+    "items(id,summary,description,location,start,end,attendees,organizer,"
+    "recurringEventId,status,updated,attachments)"
+)
+
+
 class CalendarSyncTokenExpired(Exception):
     """Raised when Google Calendar indicates the sync token is invalid."""
 
@@ -23,6 +33,12 @@ class CalendarEventsPage:
 
 
 class CalendarClient(Protocol):  # pragma: no cover - protocol definition
+    """Calendar API surface used by the poller.
+
+    Implementations should pass ``fields=CALENDAR_EVENT_FIELDS`` on every
+    events request so full syncs do not download unused attributes.
+    """
+
     def list_events(self, calendar_id: str, sync_token: str | None) -> CalendarEventsPage: ...
 
     def full_sync(self, calendar_id: str) -> CalendarEventsPage: ...
@@ -161,6 +177,7 @@ class CalendarPoller:
 
 
 __all__ = [
+    "CALENDAR_EVENT_FIELDS",
     "CalendarPoller",
     "CalendarClient",
     "CalendarEventsPage",
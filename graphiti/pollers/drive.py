@@ -2,13 +2,13 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
-from typing import Iterable, Mapping, Protocol
+from typing import Iterable, Iterator, Mapping, Protocol
 
 from ..config import GraphitiConfig, load_config
 from ..episodes import Episode, Neo4jEpisodeStore
 from ..hooks import EpisodeProcessor
 from ..state import GraphitiStateStore
-from ..utils import sleep_with_jitter
+from ..utils import bounded_map, sleep_with_jitter
 
 
 @dataclass(slots=True)
@@ -24,6 +24,13 @@ class DriveFileContent:
 
 
 class DriveClient(Protocol):  # pragma: no cover - protocol definition
+    """Drive API surface used by the poller.
+
+    With ``drive_fetch_concurrency`` above 1, ``fetch_file_content`` is called
+    from several threads at once, so the client must be thread-safe (for
+    example, one ``googleapiclient`` service object per thread).
+    """
+
     def list_changes(self, page_token: str | None) -> DriveChangesResult: ...
 
     def fetch_file_content(self, file_id: str, file_metadata: Mapping[str, object]) -> DriveFileContent: ...
@@ -55,8 +62,7 @@ class DrivePoller:
 
         result = self._drive.list_changes(page_token)
         processed = 0
-        for change in result.changes:
-            episode = self._normalize_change(change)
+        for episode in self._iter_episodes(result.changes):
             if episode is None:
                 continue
             self._episodes.upsert_episode(self._processor.process(episode))
@@ -86,8 +92,7 @@ class DrivePoller:
             result = self._backfill_page(page_token, days)
             if not result.changes:
                 break
-            for change in result.changes:
-                episode = self._normalize_change(change)
+            for episode in self._iter_episodes(result.changes):
                 if episode is None:
                     continue
                 if episode.valid_at and episode.valid_at < cutoff:
@@ -121,6 +126,16 @@ class DrivePoller:
                 return fetcher(days=days, page_token=page_token)
         return self._drive.list_changes(page_token)
 
+    def _iter_episodes(
+        self, changes: Iterable[Mapping[str, object]]
+    ) -> Iterator[Episode | None]:
+        """Normalise *changes* in order, fetching file content on up to
+        ``drive_fetch_concurrency`` threads."""
+
+        return bounded_map(
+            self._normalize_change, changes, self._config.drive_fetch_concurrency
+        )
+
     def _normalize_change(self, change: Mapping[str, object]) -> Episode | None:
         file_id = change.get("fileId")
         if not isinstance(file_id, str):  # pragma: no cover - defensive
@@ -3,13 +3,24 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
-from typing import Iterable, Mapping, Protocol
+from itertools import chain
+from typing import Iterable, Iterator, Mapping, Protocol
 
 from ..config import GraphitiConfig, load_config
 from ..episodes import Episode, Neo4jEpisodeStore
 from ..hooks import EpisodeProcessor
 from ..state import GraphitiStateStore
-from ..utils import sleep_with_jitter
+from ..utils import bounded_map, sleep_with_jitter
+
+# Gmail's batch endpoint accepts at most 100 sub-requests per call; the
+# configured gmail_batch_size is clamped to this.
+GMAIL_BATCH_SIZE = 100
+
+# Everything the poller reads from a message. Clients can request
+# ``format="metadata"`` with these headers and ``fields`` mask instead of the
+# full MIME tree, since bodies are never used.
+GMAIL_METADATA_HEADERS: tuple[str, ...] = ("From", "To", "Subject", "Date", "Message-ID")
+GMAIL_MESSAGE_FIELDS = "id,threadId,historyId,internalDate,snippet,payload/headers"
 
 
 class GmailHistoryNotFound(Exception):
@@ -23,6 +34,20 @@ class GmailHistoryResult:
 
 
 class GmailClient(Protocol):  # pragma: no cover - protocol definition
+    """Gmail API surface used by the poller.
+
+    Clients may additionally implement ``fetch_messages(message_ids)`` returning
+    a mapping of id to message for up to ``GMAIL_BATCH_SIZE`` ids in a single
+    batch request; ids missing from the mapping are fetched individually.
+
+    Messages only need the attributes in ``GMAIL_MESSAGE_FIELDS`` and the
+    headers in ``GMAIL_METADATA_HEADERS``.
+
+    With ``gmail_fetch_concurrency`` above 1 the fetch methods are called from
+    several threads at once, so the client must be thread-safe (for example,
+    one ``googleapiclient`` service object per thread).
+    """
+
     def list_history(self, start_history_id: str | None) -> GmailHistoryResult: ...
 
     def fallback_fetch(self, newer_than_days: int) -> GmailHistoryResult: ...
@@ -30,6 +55,23 @@ class GmailClient(Protocol):  # pragma: no cover - protocol definition
     def fetch_message(self, message_id: str) -> Mapping[str, object]: ...
 
 
+def _header_map(payload: object) -> dict[str, str]:
+    """Lower-cased header name to value; later duplicates win."""
+
+    if not isinstance(payload, Mapping):
+        return {}
+    headers_list = payload.get("headers")
+    if not isinstance(headers_list, Iterable):
+        return {}
+    return {
+        name.lower(): value
+        for header in headers_list
+        if isinstance(header, Mapping)
+        for name, value in ((header.get("name"), header.get("value")),)
+        if isinstance(name, str) and isinstance(value, str)
+    }
+
+
 class GmailPoller:
     """Incremental Gmail poller with fallback behavior."""
 
@@ -64,12 +106,7 @@ class GmailPoller:
             fallback_used = True
 
         processed = 0
-        seen: set[str] = set()
-        for message_id in history.message_ids:
-            if message_id in seen:
-                continue
-            seen.add(message_id)
-            message = self._gmail.fetch_message(message_id)
+        for message in self._iter_messages(history.message_ids):
             episode = self._processor.process(self._normalize_message(message))
             self._episodes.upsert_episode(episode)
             processed += 1
@@ -90,14 +127,9 @@ class GmailPoller:
         days = max(int(newer_than_days or self._config.gmail_backfill_days), 1)
         history = self._gmail.fallback_fetch(days)
         processed = 0
-        seen: set[str] = set()
         cutoff = datetime.now(timezone.utc) - timedelta(days=days)
 
-        for index, message_id in enumerate(history.message_ids, start=1):
-            if message_id in seen:
-                continue
-            seen.add(message_id)
-            message = self._gmail.fetch_message(message_id)
+        for index, message in enumerate(self._iter_messages(history.message_ids), start=1):
             episode = self._normalize_message(message)
             if episode.valid_at and episode.valid_at < cutoff:
                 continue
@@ -119,6 +151,34 @@ class GmailPoller:
         self._state.update_state(payload)
         return processed
 
+    def _iter_messages(self, message_ids: Iterable[str]) -> Iterator[Mapping[str, object]]:
+        """Yield each distinct message once, in order.
+
+        Fetches run on up to ``gmail_fetch_concurrency`` threads and use the
+        client's batch endpoint, ``gmail_batch_size`` ids at a time, when it
+        offers one.
+        """
+
+        unique_ids = list(dict.fromkeys(message_ids))
+        workers = self._config.gmail_fetch_concurrency
+        if not callable(getattr(self._gmail, "fetch_messages", None)):
+            return bounded_map(self._gmail.fetch_message, unique_ids, workers)
+        size = min(max(self._config.gmail_batch_size, 1), GMAIL_BATCH_SIZE)
+        chunks = [
+            unique_ids[start : start + size] for start in range(0, len(unique_ids), size)
+        ]
+        return chain.from_iterable(bounded_map(self._fetch_chunk, chunks, workers))
+
+    def _fetch_chunk(self, message_ids: list[str]) -> list[Mapping[str, object]]:
+        fetched = self._gmail.fetch_messages(message_ids)  # type: ignore[attr-defined]
+        if not isinstance(fetched, Mapping):
+            fetched = {}
+        messages: list[Mapping[str, object]] = []
+        for message_id in message_ids:
+            message = fetched.get(message_id)
+            messages.append(message if message is not None else self._gmail.fetch_message(message_id))
+        return messages
+
     def _normalize_message(self, message: Mapping[str, object]) -> Episode:
         message_id = str(message.get("id"))
         if not message_id:
@@ -138,17 +198,7 @@ class GmailPoller:
         history_id = str(message.get("historyId") or internal_ms)
         snippet = message.get("snippet")
 
-        headers = {}
-        payload = message.get("payload")
-        if isinstance(payload, Mapping):
-            headers_list = payload.get("headers")
-            if isinstance(headers_list, Iterable):
-                for header in headers_list:
-                    if isinstance(header, Mapping):
-                        name = header.get("name")
-                        value = header.get("value")
-                        if isinstance(name, str) and isinstance(value, str):
-                            headers[name.lower()] = value
+        headers = _header_map(message.get("payload"))
 
         from_addr = headers.get("from")
         to_addr = headers.get("to")
@@ -177,4 +227,11 @@ class GmailPoller:
         )
 
 
-__all__ = ["GmailPoller", "GmailHistoryNotFound", "GmailHistoryResult"]
+__all__ = [
+    "GMAIL_BATCH_SIZE",
+    "GMAIL_MESSAGE_FIELDS",
+    "GMAIL_METADATA_HEADERS",
+    "GmailPoller",
+    "GmailHistoryNotFound",
+    "GmailHistoryResult",
+]
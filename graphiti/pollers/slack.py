@@ -18,6 +18,8 @@ class SlackRateLimited(Exception):
     def __init__(self, retry_after: float | None = None) -> None:
         super().__init__("Slack API rate limited")
         self.retry_after = max(retry_after or 1.0, 0.1)
+        # True when Slack sent a Retry-After value rather than us defaulting.
+        self.from_header = bool(retry_after)
 
 
 class SlackClient(Protocol):  # pragma: no cover - protocol definition
@@ -286,9 +288,10 @@ class SlackPoller:
             try:
                 return func(*args, **kwargs)
             except SlackRateLimited as exc:
-                sleep_for = max(delay, exc.retry_after)
-                time.sleep(sleep_for)
-                delay = min(sleep_for * 2, 60.0)
+                # Slack's Retry-After is authoritative; only fall back to our
+                # own doubling delay when it did not send one.
+                time.sleep(exc.retry_after if exc.from_header else delay)
+                delay = min(delay * 2, 60.0)
         return func(*args, **kwargs)
 
     @staticmethod
@@ -410,6 +413,19 @@ class SlackPoller:
         return payload
 
 
+def channel_inventory(channels: Iterable[object]) -> dict[str, dict[str, Any]]:
+    """Return the ``slack.channels`` state section for a channel listing.
+
+    Entries without an id are skipped before anything is copied.
+    """
+
+    return {
+        str(channel_id): {"metadata": dict(channel)}
+        for channel in channels
+        if isinstance(channel, Mapping) and (channel_id := channel.get("id"))
+    }
+
+
 @dataclass(slots=True)
 class NullSlackClient:
     """Default Slack client that performs no operations."""
@@ -439,6 +455,7 @@ class NullSlackClient:
 
 
 __all__ = [
+    "channel_inventory",
     "SlackPoller",
     "SlackClient",
     "SlackRateLimited",
@@ -1,13 +1,16 @@
 """Local state directory manager."""
 from __future__ import annotations
 
+import copy
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Dict, Mapping, MutableMapping
-import json
 import os
+import threading
 from datetime import datetime, timezone
 
+from .utils import dumps_json, loads_json
+
 STATE_DIR_NAME = ".graphiti_sync"
 TOKENS_FILE = "tokens.json"
 STATE_FILE = "state.json"
@@ -25,6 +28,15 @@ class GraphitiStateStore:
     """Manage the on-disk state required for pollers and auth tokens."""
 
     base_dir: Path = field(default_factory=lambda: Path.home() / STATE_DIR_NAME)
+    # Serialises read-modify-write cycles when pollers share a store across threads.
+    _lock: threading.RLock = field(
+        default_factory=threading.RLock, init=False, repr=False, compare=False
+    )
+    # Parsed state.json keyed by the file's stat signature, so repeated reads
+    # (health checks, pollers) only re-parse after a write.
+    _state_cache: tuple[tuple[int, int, int], Dict[str, Any]] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def __post_init__(self) -> None:
         self.ensure_directory()
@@ -48,67 +60,80 @@ class GraphitiStateStore:
     def load_tokens(self) -> Dict[str, Any]:
         if not self.tokens_path.exists():
             return {}
-        with self.tokens_path.open("r", encoding="utf-8") as fh:
-            return json.load(fh)
+        return loads_json(self.tokens_path.read_bytes())
 
     def save_tokens(self, tokens: Mapping[str, Any]) -> None:
-        self._write_json(self.tokens_path, tokens)
+        with self._lock:
+            self._write_json(self.tokens_path, tokens)
 
     def load_state(self) -> Dict[str, Any]:
-        if not self.state_path.exists():
+        """Return a private copy of the current state."""
+
+        try:
+            st = self.state_path.stat()
+        except FileNotFoundError:
             return {}
-        with self.state_path.open("r", encoding="utf-8") as fh:
-            return json.load(fh)
+        key = (st.st_mtime_ns, st.st_size, st.st_ino)
+        cached = self._state_cache
+        if cached is None or cached[0] != key:
+            cached = (key, loads_json(self.state_path.read_bytes()))
+            self._state_cache = cached
+        return copy.deepcopy(cached[1])
 
     def save_state(self, state: Mapping[str, Any]) -> None:
-        self._write_json(self.state_path, state)
+        with self._lock:
+            self._write_json(self.state_path, state)
+            self._state_cache = None
 
     def update_state(self, update: Mapping[str, Any]) -> Dict[str, Any]:
-        current = self.load_state()
-        merged = _deep_merge(current, update)
-        self.save_state(merged)
-        return merged
+        with self._lock:
+            current = self.load_state()
+            merged = _deep_merge(current, update)
+            self.save_state(merged)
+            return merged
 
     def record_error(self, source: str, message: str | None = None) -> Dict[str, Any]:
         if not source:
             raise ValueError("source must be provided")
-        state = self.load_state()
-        source_state = state.get(source) if isinstance(state.get(source), Mapping) else {}
-        try:
-            current_count = int(source_state.get("error_count", 0))
-        except (TypeError, ValueError):
-            current_count = 0
-        payload: Dict[str, Any] = {
-            source: {
-                "error_count": current_count + 1,
-                "last_error_at": datetime.now(timezone.utc).isoformat(),
+        with self._lock:
+            state = self.load_state()
+            source_state = state.get(source) if isinstance(state.get(source), Mapping) else {}
+            try:
+                current_count = int(source_state.get("error_count", 0))
+            except (TypeError, ValueError):
+                current_count = 0
+            payload: Dict[str, Any] = {
+                source: {
+                    "error_count": current_count + 1,
+                    "last_error_at": datetime.now(timezone.utc).isoformat(),
+                }
             }
-        }
-        if message:
-            payload[source]["last_error_message"] = message
-        return self.update_state(payload)
+            if message:
+                payload[source]["last_error_message"] = message
+            return self.update_state(payload)
 
     def clear_errors(self, source: str) -> Dict[str, Any]:
         if not source:
             raise ValueError("source must be provided")
-        state = self.load_state()
-        current = state.get(source)
-        if not isinstance(current, Mapping):
-            return state
-        cleaned = dict(current)
-        cleaned.pop("error_count", None)
-        cleaned.pop("last_error_at", None)
-        cleaned.pop("last_error_message", None)
-        new_state = dict(state)
-        new_state[source] = cleaned
-        self.save_state(new_state)
-        return new_state
+        with self._lock:
+            state = self.load_state()
+            current = state.get(source)
+            if not isinstance(current, Mapping):
+                return state
+            cleaned = dict(current)
+            cleaned.pop("error_count", None)
+            cleaned.pop("last_error_at", None)
+            cleaned.pop("last_error_message", None)
+            new_state = dict(state)
+            new_state[source] = cleaned
+            self.save_state(new_state)
+            return new_state
 
     def _write_json(self, path: Path, data: Mapping[str, Any]) -> None:
         tmp_path = path.with_suffix(".tmp")
-        with tmp_path.open("w", encoding="utf-8") as fh:
-            json.dump(data, fh, indent=2, sort_keys=True)
-            fh.write("\n")
+        tmp_path.write_text(
+            dumps_json(data, indent=True, sort_keys=True) + "\n", encoding="utf-8"
+        )
         os.replace(tmp_path, path)
         _ensure_mode(path, 0o600)
 
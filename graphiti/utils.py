@@ -1,8 +1,19 @@
 """Common helper utilities used across Graphiti modules."""
 from __future__ import annotations
 
+import json
 import random
+import threading
 import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime, timezone
+from typing import Any, Callable, Iterable, Iterator, TypeVar
+
+try:  # pragma: no cover - optional dependency
+    import orjson
+except ImportError:  # pragma: no cover - executed when orjson missing
+    orjson = None  # type: ignore[assignment]
 
 
 def sleep_with_jitter(base: float = 0.5, jitter: float = 0.25) -> float:
@@ -17,4 +28,102 @@ def sleep_with_jitter(base: float = 0.5, jitter: float = 0.25) -> float:
     return delay
 
 
-__all__ = ["sleep_with_jitter"]
+_T = TypeVar("_T")
+_R = TypeVar("_R")
+
+
+def bounded_map(
+    func: Callable[[_T], _R], items: Iterable[_T], max_workers: int
+) -> Iterator[_R]:
+    """Apply *func* to *items* on at most *max_workers* threads, yielding in order.
+
+    *items* is consumed lazily: at most ``2 * max_workers`` calls are in flight
+    ahead of the consumer. With one worker or fewer the calls run inline on the
+    caller's thread.
+    """
+
+    if max_workers <= 1:
+        yield from map(func, items)
+        return
+    window = max_workers * 2
+    pending: deque[Future[_R]] = deque()
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        try:
+            for item in items:
+                if len(pending) >= window:
+                    yield pending.popleft().result()
+                pending.append(executor.submit(func, item))
+            while pending:
+                yield pending.popleft().result()
+        finally:
+            for future in pending:
+                future.cancel()
+
+
+_clock = threading.local()
+
+
+def utc_now_iso() -> str:
+    """Return the current UTC time as an ISO-8601 string at one-second resolution.
+
+    The formatted value is cached per thread and reused until the second
+    changes, which is plenty for run and inventory timestamps.
+    """
+
+    seconds = int(time.time())
+    cached = getattr(_clock, "value", None)
+    if cached is not None and cached[0] == seconds:
+        return cached[1]
+    text = datetime.fromtimestamp(seconds, tz=timezone.utc).isoformat()
+    _clock.value = (seconds, text)
+    return text
+
+
+def dumps_json(
+    value: Any,
+    *,
+    indent: bool = False,
+    sort_keys: bool = False,
+    default: Callable[[Any], Any] | None = None,
+) -> str:
+    """Serialise *value* to JSON text, using orjson when it is installed.
+
+    ``indent`` produces the same two-space layout as ``json.dumps(indent=2)``.
+    Payloads orjson rejects (for example non-string keys) fall back to the
+    standard library encoder.
+    """
+
+    if orjson is not None:
+        option = 0
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        try:
+            return orjson.dumps(value, default=default, option=option).decode()
+        except TypeError:
+            pass
+    return json.dumps(
+        value,
+        indent=2 if indent else None,
+        sort_keys=sort_keys,
+        default=default,
+    )
+
+
+def loads_json(data: bytes | str) -> Any:
+    """Parse JSON *data*, using orjson when it is installed.
+
+    Documents orjson rejects but the standard library accepts (``NaN`` and
+    ``Infinity`` literals) are retried with :func:`json.loads`.
+    """
+
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
+
+
+__all__ = ["bounded_map", "dumps_json", "loads_json", "sleep_with_jitter", "utc_now_iso"]
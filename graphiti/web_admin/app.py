@@ -6,11 +6,13 @@ import base64
 import hashlib
 import secrets
 import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
 from datetime import datetime, timedelta, timezone
 from html import escape
 from pathlib import Path
 from string import Template
-from typing import Any, Mapping
+from typing import Any, AsyncIterator, Mapping
 from urllib.parse import urlencode
 
 import requests
@@ -33,11 +35,13 @@ from ..cli import (
     create_gmail_poller,
     create_slack_client,
 )
-from ..config import ConfigStore, GraphitiConfig
+from ..config import ConfigStore, GraphitiConfig, _normalise_sequence
+from ..episodes import Neo4jEpisodeStore
 from ..logs import GraphitiLogStore
 from ..maintenance import BackupScheduler
-from ..pollers.slack import SlackPoller
+from ..pollers.slack import SlackPoller, channel_inventory
 from ..state import GraphitiStateStore
+from ..utils import loads_json
 
 
 class RedactionRule(BaseModel):
@@ -215,6 +219,10 @@ class ConfigPayload(BaseModel):
     drive_backfill_days: int = Field(..., ge=1)
     calendar_backfill_days: int = Field(..., ge=1)
     slack_backfill_days: int = Field(..., ge=1)
+    gmail_fetch_concurrency: int = Field(1, ge=1)
+    drive_fetch_concurrency: int = Field(1, ge=1)
+    gmail_batch_size: int = Field(50, ge=1, le=100)
+    thread_pool_size: int = Field(8, ge=1)
     slack_search_query: str = Field("", min_length=0)
     calendar_ids: list[str] = Field(default_factory=lambda: ["primary"])
     redaction_rules_path: str | None = None
@@ -234,19 +242,8 @@ class ConfigPayload(BaseModel):
 
         if value is None:
             return []
-        if isinstance(value, str):
-            items = [item.strip() for item in value.split(",") if item.strip()]
-        else:
-            items = [str(item).strip() for item in value if str(item).strip()]
-        seen: set[str] = set()
-        result: list[str] = []
-        for item in items:
-            lowered = item.lower()
-            if lowered in seen:
-                continue
-            seen.add(lowered)
-            result.append(item)
-        return result
+        items = value.split(",") if isinstance(value, str) else map(str, value)
+        return list(_normalise_sequence(items))
 
     @validator("logs_directory", pre=True)
     def _empty_to_none(cls, value: Any) -> str | None:  # noqa: D401,N805
@@ -293,6 +290,8 @@ def create_app(config_path: Path | None = None) -> FastAPI:
         log_store=log_store,
     )
 
+    http_session = requests.Session()
+
     app = FastAPI(title="Personal Assistant Admin", version="1.0.0")
 
     def _refresh_log_store(config: GraphitiConfig) -> None:
@@ -301,11 +300,43 @@ def create_app(config_path: Path | None = None) -> FastAPI:
         log_store.prune(config.log_retention_days)
         scheduler.update_log_store(log_store)
 
+    # One Neo4j driver (and its connection pool) serves every manual run; it
+    # is only rebuilt when the connection settings or group change. Runs lease
+    # the store so a replaced driver is closed only once its last run is done.
+    episode_store: Neo4jEpisodeStore | None = None
+    episode_store_key: tuple[str, ...] = ()
+    episode_store_leases: dict[Neo4jEpisodeStore, int] = {}
+    episode_store_lock = asyncio.Lock()
+
+    @asynccontextmanager
+    async def _leased_episode_store(
+        config: GraphitiConfig,
+    ) -> AsyncIterator[Neo4jEpisodeStore]:
+        nonlocal episode_store, episode_store_key
+        key = (config.neo4j_uri, config.neo4j_user, config.neo4j_password, config.group_id)
+        async with episode_store_lock:
+            if episode_store is None or key != episode_store_key:
+                replaced = episode_store
+                episode_store = await asyncio.to_thread(create_episode_store, config)
+                episode_store_key = key
+                if replaced is not None and replaced not in episode_store_leases:
+                    await asyncio.to_thread(close_episode_store, replaced)
+            leased = episode_store
+            episode_store_leases[leased] = episode_store_leases.get(leased, 0) + 1
+        try:
+            yield leased
+        finally:
+            async with episode_store_lock:
+                episode_store_leases[leased] -= 1
+                if not episode_store_leases[leased]:
+                    del episode_store_leases[leased]
+                    if leased is not episode_store:
+                        await asyncio.to_thread(close_episode_store, leased)
+
     async def _run_manual_load(source: str, days: int) -> dict[str, Any]:
         config = store.load()
-        episode_store = create_episode_store(config)
         processed = 0
-        try:
+        async with _leased_episode_store(config) as episode_store:
             if source == "gmail":
                 poller = create_gmail_poller(config, state_store, episode_store)
                 processed = await asyncio.to_thread(poller.backfill, days)
@@ -328,8 +359,6 @@ def create_app(config_path: Path | None = None) -> FastAPI:
                 processed = await asyncio.to_thread(poller.backfill, days)
             else:  # pragma: no cover - defensive
                 raise HTTPException(status_code=404, detail="Unknown source")
-        finally:
-            close_episode_store(episode_store)
 
         log_store.append(
             "episodes",
@@ -347,9 +376,8 @@ def create_app(config_path: Path | None = None) -> FastAPI:
 
     async def _run_poller_once(source: str) -> dict[str, Any]:
         config = store.load()
-        episode_store = create_episode_store(config)
         processed = 0
-        try:
+        async with _leased_episode_store(config) as episode_store:
             if source == "gmail":
                 poller = create_gmail_poller(config, state_store, episode_store)
                 processed = await asyncio.to_thread(poller.run_once)
@@ -372,8 +400,6 @@ def create_app(config_path: Path | None = None) -> FastAPI:
                 processed = await asyncio.to_thread(poller.run_once)
             else:  # pragma: no cover - defensive
                 raise HTTPException(status_code=404, detail="Unknown source")
-        finally:
-            close_episode_store(episode_store)
 
         config = store.load()
         log_store.append(
@@ -386,11 +412,26 @@ def create_app(config_path: Path | None = None) -> FastAPI:
 
     @app.on_event("startup")
     async def _startup() -> None:  # pragma: no cover - exercised in integration
+        # Pollers, backfills and token writes run through asyncio.to_thread;
+        # size that pool from config rather than the CPU-derived default.
+        asyncio.get_running_loop().set_default_executor(
+            ThreadPoolExecutor(
+                max_workers=max(store.load().thread_pool_size, 1),
+                thread_name_prefix="graphiti",
+            )
+        )
         await scheduler.start()
 
     @app.on_event("shutdown")
     async def _shutdown() -> None:  # pragma: no cover - exercised in integration
+        nonlocal episode_store
         await scheduler.stop()
+        http_session.close()
+        async with episode_store_lock:
+            # Stores still leased by in-flight runs close when those runs finish.
+            if episode_store is not None and episode_store not in episode_store_leases:
+                await asyncio.to_thread(close_episode_store, episode_store)
+            episode_store = None
 
     @app.get("/", response_class=HTMLResponse)
     async def index() -> HTMLResponse:
@@ -501,7 +542,7 @@ def create_app(config_path: Path | None = None) -> FastAPI:
             "redirect_uri": session["redirect_uri"],
         }
         try:
-            response = requests.post(
+            response = http_session.post(
                 "https://oauth2.googleapis.com/token",
                 data=data,
                 timeout=20,
@@ -512,7 +553,7 @@ def create_app(config_path: Path | None = None) -> FastAPI:
                 content=_oauth_result_page(False, f"Token exchange failed: {exc}"),
                 status_code=502,
             )
-        payload = response.json()
+        payload = loads_json(response.content)
         google_tokens = _load_token_section(state_store, "google")
         google_tokens.update(
             {
@@ -534,7 +575,7 @@ def create_app(config_path: Path | None = None) -> FastAPI:
         if isinstance(expires_in, (int, float)):
             expiry = datetime.now(timezone.utc) + timedelta(seconds=float(expires_in))
             google_tokens["access_token_expires_at"] = expiry.isoformat()
-        _persist_token_section(state_store, "google", google_tokens)
+        await asyncio.to_thread(_persist_token_section, state_store, "google", google_tokens)
         return HTMLResponse(
             content=_oauth_result_page(True, "Google authorisation complete. You can close this window."),
         )
@@ -557,7 +598,7 @@ def create_app(config_path: Path | None = None) -> FastAPI:
         }
         if not tokens["user_token"]:
             raise HTTPException(status_code=400, detail="A Slack user token is required.")
-        saved = _persist_token_section(state_store, "slack", tokens)
+        saved = await asyncio.to_thread(_persist_token_section, state_store, "slack", tokens)
         log_store.append(
             "system",
             "Slack credentials updated",
@@ -574,11 +615,7 @@ def create_app(config_path: Path | None = None) -> FastAPI:
         state_store.update_state(
             {
                 "slack": {
-                    "channels": {
-                        str(entry.get("id")): {"metadata": dict(entry)}
-                        for entry in channels
-                        if isinstance(entry, Mapping) and entry.get("id")
-                    },
+                    "channels": channel_inventory(channels),
                     "last_inventory_at": datetime.now(timezone.utc).isoformat(),
                 }
             }
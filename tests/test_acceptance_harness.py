@@ -3,7 +3,7 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 
 from graphiti.config import GraphitiConfig
-from graphiti.harness import AcceptanceTestHarness, build_fixture_dataset
+from graphiti.harness import AcceptanceTestHarness, _HarnessSlackClient, build_fixture_dataset
 
 
 @dataclass
@@ -31,3 +31,21 @@ def test_acceptance_harness_runs_pollers(tmp_path):
 
     sources = {episode.source for episode in store.episodes}
     assert sources >= {"gmail", "gdrive", "calendar", "slack", "mcp"}
+
+
+def test_harness_slack_search_orders_and_filters_by_oldest():
+    client = _HarnessSlackClient(
+        [{"id": "C1", "name": "general"}, {"id": "C2", "name": "random"}],
+        {
+            "C1": [{"ts": "3", "text": "c"}, {"ts": "1", "text": "a"}],
+            "C2": [{"ts": "2", "text": "b"}],
+        },
+        {},
+    )
+
+    everything = client.search_messages("q")["messages"]
+    assert [message["text"] for message in everything] == ["a", "b", "c"]
+    assert everything[1]["channel"] == {"id": "C2", "name": "random"}
+
+    newer = client.search_messages("q", oldest="2")["messages"]
+    assert [message["text"] for message in newer] == ["c"]
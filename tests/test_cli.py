@@ -5,6 +5,8 @@ import pathlib
 from pathlib import Path
 from unittest import mock
 
+import pytest
+
 from graphiti import GraphitiStateStore, cli
 
 
@@ -158,6 +160,19 @@ def test_cli_sync_scheduler_once(monkeypatch, tmp_path, capsys):
     assert {entry["source"] for entry in metrics} == {"gmail", "drive", "calendar", "slack"}
 
 
+def test_cli_schema_init_closes_store_on_failure(monkeypatch, tmp_path):
+    monkeypatch.setattr(pathlib.Path, "home", lambda: tmp_path)
+    store = mock.Mock(group_id="group")
+    store.ensure_indexes.side_effect = RuntimeError("no schema privileges")
+    closed = []
+    monkeypatch.setattr(cli, "create_episode_store", lambda config: store)
+    monkeypatch.setattr(cli, "close_episode_store", closed.append)
+
+    with pytest.raises(RuntimeError):
+        cli.main(["schema", "init"])
+    assert closed == [store]
+
+
 def test_cli_backup_state(monkeypatch, tmp_path, capsys):
     monkeypatch.setattr(pathlib.Path, "home", lambda: tmp_path)
     store = GraphitiStateStore()
@@ -28,10 +28,14 @@ def test_environment_overrides_store(
 
     monkeypatch.setenv("NEO4J_URI", "bolt://env:7687")
     monkeypatch.setenv("POLL_GMAIL_DRIVE_CAL", "120")
+    monkeypatch.setenv("GMAIL_FETCH_CONCURRENCY", "4")
+    monkeypatch.setenv("THREAD_POOL_SIZE", "3")
 
     config = load_config()
     assert config.neo4j_uri == "bolt://env:7687"
     assert config.poll_gmail_drive_calendar_seconds == 120
+    assert config.gmail_fetch_concurrency == 4
+    assert config.thread_pool_size == 3
 
 
 def test_invalid_numeric_input_raises(
@@ -63,3 +67,39 @@ def test_config_store_round_trip(config_path: Path) -> None:
         ("secret@example.com", "[MASKED]"),
         ("(?i)password", "***"),
     )
+
+
+def test_dotenv_file_overrides_store(config_path: Path, tmp_path: Path) -> None:
+    dotenv = tmp_path / ".env"
+    dotenv.write_text(
+        "# comment\n"
+        "NEO4J_URI = \"bolt://dotenv:7687\" \n"
+        "  # GROUP_ID=ignored\n"
+        "not a pair\n"
+        "SLACK_SEARCH_QUERY='in:general'\n"
+    )
+
+    config = load_config(dotenv_path=dotenv, environ={})
+    assert config.neo4j_uri == "bolt://dotenv:7687"
+    assert config.slack_search_query == "in:general"
+    assert config.group_id == "mike_assistant"
+
+
+def test_config_store_load_reuses_parse_until_file_changes(config_path: Path) -> None:
+    store = ConfigStore(config_path)
+    store.save(GraphitiConfig(group_id="first"))
+
+    first = store.load()
+    assert store.load() is first
+
+    store.save(GraphitiConfig(group_id="second"))
+    reloaded = store.load()
+    assert reloaded is not first
+    assert reloaded.group_id == "second"
+
+
+def test_load_config_reuses_merged_config_until_overrides_change(config_path: Path) -> None:
+    first = load_config(environ={"GROUP_ID": "env_group"})
+    assert first.group_id == "env_group"
+    assert load_config(environ={"GROUP_ID": "env_group"}) is first
+    assert load_config(environ={"GROUP_ID": "other"}).group_id == "other"
@@ -4,6 +4,7 @@ from datetime import datetime, timezone
 
 import pytest
 
+from graphiti import cursor
 from graphiti.cursor import CursorTool, GraphitiCursorToolset, GraphitiQueryService
 
 
@@ -31,15 +32,16 @@ class FakeTx:
         self.last_query = None
         self.last_params = None
 
-    def run(self, statement, **params):
+    def run(self, statement, parameters=None, **kwargs):
         self.last_query = statement
-        self.last_params = params
+        self.last_params = {**(parameters or {}), **kwargs}
         return FakeResult(self._records)
 
 
 class FakeSession:
     def __init__(self, records):
         self.records = records
+        self.last_tx = None
 
     def __enter__(self):
         return self
@@ -47,17 +49,21 @@ class FakeSession:
     def __exit__(self, exc_type, exc, tb):
         return False
 
-    def execute_read(self, func, params):
+    def execute_read(self, func, *args):
         tx = FakeTx(self.records)
-        return func(tx, params)
+        self.last_tx = tx
+        return func(tx, *args)
 
 
 class FakeDriver:
     def __init__(self, records):
         self.records = records
+        self.last_session = None
 
-    def session(self):
-        return FakeSession(self.records)
+    def session(self, **config):
+        assert config == {"default_access_mode": "READ"}
+        self.last_session = FakeSession(self.records)
+        return self.last_session
 
 
 @pytest.fixture()
@@ -71,6 +77,108 @@ def test_hybrid_search(driver):
     assert results[0]["episode_id"] == "1"
 
 
+def test_hybrid_search_uses_fulltext_index(driver):
+    service = GraphitiQueryService(driver, group_id="group")
+    service.hybrid_search("status: done", limit=3, source="slack")
+    tx = driver.last_session.last_tx
+    assert "db.index.fulltext.queryNodes" in tx.last_query
+    assert tx.last_params["query"] == "status\\: done"
+    assert tx.last_params["source"] == "slack"
+    assert tx.last_params["text_limit"] == 500
+    assert "substring(e.text, 0, $text_limit)" in tx.last_query
+
+    assert ".metadata" not in tx.last_query and ".*" not in tx.last_query
+
+    service.hybrid_search("hello", include_metadata=True)
+    assert driver.last_session.last_tx.last_params["source"] is None
+    assert ".*" in driver.last_session.last_tx.last_query
+
+
+@pytest.mark.parametrize(
+    ("query", "expected"),
+    [("cats AND", "cats and"), ("foo OR", "foo or"), ("NOT", "not"), ("ANDROID", "ANDROID")],
+)
+def test_hybrid_search_neutralises_boolean_keywords(driver, query, expected):
+    service = GraphitiQueryService(driver, group_id="group")
+    service.hybrid_search(query)
+    params = driver.last_session.last_tx.last_params
+    assert params["query"] == expected
+    assert params["needle"] == query.lower()
+
+
+def test_hybrid_search_falls_back_without_fulltext_index(driver, monkeypatch):
+    queries = []
+    original_run = FakeTx.run
+
+    def run(self, statement, parameters=None, **kwargs):
+        queries.append(statement)
+        if "queryNodes" in statement:
+            raise RuntimeError("There is no such fulltext schema index: episode_text")
+        return original_run(self, statement, parameters, **kwargs)
+
+    monkeypatch.setattr(FakeTx, "run", run)
+    service = GraphitiQueryService(driver, group_id="group")
+    assert service.hybrid_search("HeLLo")[0]["episode_id"] == "1"
+    assert driver.last_session.last_tx.last_params["needle"] == "hello"
+    service.hybrid_search("hello")
+    assert ["queryNodes" in query for query in queries] == [True, False, False]
+
+
+def test_hybrid_search_retries_fulltext_index_after_ttl(driver, monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(cursor.time, "monotonic", lambda: now[0])
+    missing = [True]
+    queries = []
+    original_run = FakeTx.run
+
+    def run(self, statement, parameters=None, **kwargs):
+        queries.append(statement)
+        if "queryNodes" in statement and missing[0]:
+            raise RuntimeError("There is no such fulltext schema index: episode_text")
+        return original_run(self, statement, parameters, **kwargs)
+
+    monkeypatch.setattr(FakeTx, "run", run)
+    service = GraphitiQueryService(driver, group_id="group")
+    service.hybrid_search("hello")
+    now[0] += cursor._FULLTEXT_RETRY_SECONDS - 1
+    service.hybrid_search("hello")
+    missing[0] = False
+    now[0] += 1
+    service.hybrid_search("hello")
+    service.hybrid_search("hello")
+    assert ["queryNodes" in query for query in queries] == [True, False, False, True, True]
+
+
+def test_hybrid_search_decodes_json_properties(driver):
+    driver.records = [[FakeNode({"episode_id": "1", "metadata": '{"thread_id": "t1"}'})]]
+    service = GraphitiQueryService(driver, group_id="group")
+    first = service.hybrid_search("hello", include_metadata=True)[0]
+    assert first["metadata"] == {"thread_id": "t1"}
+    first["metadata"]["thread_id"] = "changed"
+    second = service.hybrid_search("hello", include_metadata=True)[0]
+    assert second["metadata"] == {"thread_id": "t1"}
+
+
+def test_hybrid_search_nested_json_is_not_shared(driver):
+    driver.records = [[FakeNode({"episode_id": "1", "metadata": '{"thread": {"labels": ["a"]}}'})]]
+    service = GraphitiQueryService(driver, group_id="group")
+    first = service.hybrid_search("hello", include_metadata=True)[0]
+    first["metadata"]["thread"]["labels"].append("b")
+    second = service.hybrid_search("hello", include_metadata=True)[0]
+    assert second["metadata"] == {"thread": {"labels": ["a"]}}
+
+
+def test_hybrid_search_indexes_tuple_records(driver):
+    driver.records = [(FakeNode({"episode_id": "1"}),), (FakeNode({"episode_id": "2"}),)]
+    service = GraphitiQueryService(driver, group_id="group")
+    assert [row["episode_id"] for row in service.hybrid_search("hello")] == ["1", "2"]
+
+
+def test_query_service_requires_driver():
+    with pytest.raises(ValueError):
+        GraphitiQueryService(None, group_id="group")
+
+
 def test_as_of_returns_none(driver):
     driver.records = []
     service = GraphitiQueryService(driver, group_id="group")
@@ -106,9 +214,19 @@ def test_toolset_dispatch(driver):
     tools = {tool.name: tool for tool in toolset.tools()}
     hybrid = tools["graphiti_hybrid_search"]
     assert hybrid.run(query="hello")
+    with pytest.raises(ValueError):
+        hybrid.run(query="hello", include_metadata="yes")
     with pytest.raises(ValueError):
         tools["graphiti_as_of"].run(source="gmail", native_id="id")
     result = tools["graphiti_as_of"].run(
         source="gmail", native_id="id", as_of=datetime.now(timezone.utc).isoformat()
     )
     assert result == driver.records[0][0]._properties
+
+
+def test_toolset_reuses_built_tools(driver):
+    toolset = GraphitiCursorToolset(GraphitiQueryService(driver, group_id="group"))
+    first = toolset.tools()
+    second = toolset.tools()
+    assert first is not second
+    assert [a is b for a, b in zip(first, second)] == [True, True, True]
@@ -77,3 +77,22 @@ def test_drive_poller_validates_group(tmp_path):
 
     with pytest.raises(ValueError):
         DrivePoller(mock.MagicMock(), episode_store, state_store, config)
+
+
+def test_drive_poller_fetches_content_concurrently_in_order(tmp_path):
+    config = GraphitiConfig(group_id="test_group", drive_fetch_concurrency=4)
+    drive_client = mock.MagicMock()
+    drive_client.list_changes.return_value = DriveChangesResult(
+        [_change(f"f{index}") for index in range(8)], "token-2"
+    )
+    drive_client.fetch_file_content.side_effect = lambda file_id, _meta: DriveFileContent(file_id, {})
+
+    episode_store = mock.MagicMock(spec=Neo4jEpisodeStore)
+    type(episode_store).group_id = mock.PropertyMock(return_value=config.group_id)
+    state_store = GraphitiStateStore(base_dir=tmp_path / "state")
+
+    poller = DrivePoller(drive_client, episode_store, state_store, config)
+    assert poller.run_once() == 8
+
+    upserted = [call.args[0].native_id for call in episode_store.upsert_episode.call_args_list]
+    assert upserted == [f"f{index}" for index in range(8)]
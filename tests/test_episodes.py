@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+from dataclasses import replace
 from datetime import datetime, timezone
+from types import MappingProxyType
 from unittest import mock
 
 import pytest
@@ -26,6 +28,53 @@ def test_episode_properties_include_optional_fields() -> None:
     assert props["json"] == {"key": "value"}
 
 
+def test_episode_properties_convert_non_dict_mappings() -> None:
+    metadata = {"message_id": "mid"}
+    episode = Episode(
+        group_id="mike_assistant",
+        source="gmail",
+        native_id="mid",
+        version="123",
+        valid_at=datetime(2024, 1, 1, tzinfo=timezone.utc),
+        json=MappingProxyType({"key": "value"}),
+        metadata=metadata,
+    )
+    props = episode.to_properties()
+    assert props["metadata"] is metadata
+    assert type(props["json"]) is dict
+    assert props["json"] == {"key": "value"}
+
+
+def test_episode_id_tracks_field_changes() -> None:
+    episode = Episode(
+        group_id="mike_assistant",
+        source="gmail",
+        native_id="mid",
+        version="123",
+        valid_at=datetime(2024, 1, 1, tzinfo=timezone.utc),
+    )
+    assert replace(episode, version="124").episode_id() == "gmail:mid:124"
+
+    episode.version = "125"
+    assert episode.episode_id() == "gmail:mid:125"
+    assert episode.to_properties()["episode_id"] == "gmail:mid:125"
+
+
+def test_episode_accepts_str_subclasses_and_none() -> None:
+    class Source(str):
+        pass
+
+    episode = Episode(
+        group_id=None,  # type: ignore[arg-type]
+        source=Source("gmail"),
+        native_id="mid",
+        version="1",
+        valid_at=datetime(2024, 1, 1, tzinfo=timezone.utc),
+    )
+    assert episode.group_id is None
+    assert episode.episode_id() == "gmail:mid:1"
+
+
 def test_upsert_episode_executes_queries_in_order() -> None:
     driver = mock.MagicMock()
     session = driver.session.return_value.__enter__.return_value
@@ -45,6 +94,57 @@ def test_upsert_episode_executes_queries_in_order() -> None:
     session.execute_write.assert_any_call(store._write_episode, episode)
 
 
+def test_upsert_episodes_batches_writes() -> None:
+    driver = mock.MagicMock()
+    session = driver.session.return_value.__enter__.return_value
+    episodes = [
+        Episode(
+            group_id="mike_assistant",
+            source="mcp",
+            native_id=f"turn-{idx}",
+            version="1",
+            valid_at=datetime(2024, 1, 1, tzinfo=timezone.utc),
+        )
+        for idx in range(5)
+    ]
+
+    store = Neo4jEpisodeStore(driver, group_id="mike_assistant")
+    assert store.upsert_episodes(episodes, batch_size=2) == 5
+
+    batches = [call.args[1] for call in session.execute_write.call_args_list]
+    assert [len(batch) for batch in batches] == [2, 2, 1]
+    assert batches[0][0]["episode_id"] == "mcp:turn-0:1"
+    assert batches[0][0]["properties"]["native_id"] == "turn-0"
+    driver.session.assert_called_once()
+
+    with pytest.raises(ValueError):
+        store.upsert_episodes([replace(episodes[0], group_id="other")])
+    assert store.upsert_episodes([]) == 0
+
+
+def test_upsert_episodes_splits_versions_of_one_item() -> None:
+    driver = mock.MagicMock()
+    session = driver.session.return_value.__enter__.return_value
+    first = Episode(
+        group_id="mike_assistant",
+        source="drive",
+        native_id="file",
+        version="1",
+        valid_at=datetime(2024, 1, 1, tzinfo=timezone.utc),
+    )
+    second = replace(first, version="2", valid_at=datetime(2024, 1, 2, tzinfo=timezone.utc))
+    other = replace(first, native_id="other")
+
+    store = Neo4jEpisodeStore(driver, group_id="mike_assistant")
+    assert store.upsert_episodes([first, other, second]) == 3
+
+    batches = [call.args[1] for call in session.execute_write.call_args_list]
+    assert [[row["episode_id"] for row in batch] for batch in batches] == [
+        ["drive:file:1", "drive:other:1"],
+        ["drive:file:2"],
+    ]
+
+
 def test_upsert_episode_rejects_mismatched_group() -> None:
     driver = mock.MagicMock()
     store = Neo4jEpisodeStore(driver, group_id="expected")
@@ -73,6 +73,42 @@ def test_gmail_poller_uses_fallback_on_missing_history(tmp_path):
     assert saved["fallback_used"] is True
 
 
+def test_gmail_poller_batches_message_fetches(tmp_path):
+    config = GraphitiConfig(group_id="test_group")
+    gmail_client = mock.MagicMock()
+    gmail_client.list_history.return_value = GmailHistoryResult(["m1", "m2", "m1", "m3"], "456")
+    gmail_client.fetch_messages.return_value = {"m1": _message("m1"), "m2": _message("m2")}
+    gmail_client.fetch_message.return_value = _message("m3")
+
+    episode_store = mock.MagicMock(spec=Neo4jEpisodeStore)
+    type(episode_store).group_id = mock.PropertyMock(return_value=config.group_id)
+    state_store = GraphitiStateStore(base_dir=tmp_path / "state")
+
+    poller = GmailPoller(gmail_client, episode_store, state_store, config)
+    assert poller.run_once() == 3
+
+    gmail_client.fetch_messages.assert_called_once_with(["m1", "m2", "m3"])
+    gmail_client.fetch_message.assert_called_once_with("m3")
+    native_ids = [call.args[0].native_id for call in episode_store.upsert_episode.call_args_list]
+    assert native_ids == ["m1", "m2", "m3"]
+
+
+def test_gmail_poller_honours_configured_batch_size(tmp_path):
+    config = GraphitiConfig(group_id="test_group", gmail_batch_size=2)
+    gmail_client = mock.MagicMock()
+    gmail_client.list_history.return_value = GmailHistoryResult(["m1", "m2", "m3"], "456")
+    gmail_client.fetch_messages.side_effect = lambda ids: {i: _message(i) for i in ids}
+
+    episode_store = mock.MagicMock(spec=Neo4jEpisodeStore)
+    type(episode_store).group_id = mock.PropertyMock(return_value=config.group_id)
+    state_store = GraphitiStateStore(base_dir=tmp_path / "state")
+
+    poller = GmailPoller(gmail_client, episode_store, state_store, config)
+    assert poller.run_once() == 3
+    batches = sorted(call.args[0] for call in gmail_client.fetch_messages.call_args_list)
+    assert batches == [["m1", "m2"], ["m3"]]
+
+
 def test_gmail_poller_validates_group_id(tmp_path):
     config = GraphitiConfig(group_id="expected")
     episode_store = mock.MagicMock(spec=Neo4jEpisodeStore)
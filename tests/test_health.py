@@ -54,6 +54,16 @@ def test_format_dashboard_outputs_table(tmp_path):
     output = format_dashboard(metrics)
     assert "Personal Assistant Sync Status" in output
     assert "slack" in output
+    assert "2024-01-01 00:00:00" in output
+
+
+def test_format_dashboard_summarises_fresh_install(tmp_path):
+    store = GraphitiStateStore(base_dir=tmp_path / "state")
+    metrics = collect_health_metrics(store, GraphitiConfig(group_id="g"))
+    output = format_dashboard(metrics)
+    assert "No sources have run yet." in output
+    assert "gmail" not in output
+    assert output.endswith("Overall status: PENDING")
 
 
 def test_health_app_returns_json(tmp_path):
@@ -75,3 +85,66 @@ def test_health_app_returns_json(tmp_path):
     payload = b"".join(result)
     assert body.status == "200 OK"
     assert payload.startswith(b"{")
+
+
+def test_health_app_serves_cached_body_until_ttl(tmp_path, monkeypatch):
+    store = GraphitiStateStore(base_dir=tmp_path / "state")
+    app = HealthApp(
+        config=GraphitiConfig(group_id="g", poll_slack_active_seconds=40),
+        state_store=store,
+    )
+    clock = [100.0]
+    monkeypatch.setattr("graphiti.health.time.monotonic", lambda: clock[0])
+
+    environ: dict[str, object] = {}
+    setup_testing_defaults(environ)
+    environ["PATH_INFO"] = "/health"
+    headers: dict[str, str] = {}
+
+    def start_response(status, response_headers):
+        headers.update(response_headers)
+
+    first = b"".join(app(environ, start_response))
+    assert headers["Cache-Control"] == "max-age=10, stale-while-revalidate=20"
+
+    store.update_state({"gmail": {"last_run_at": "2024-01-01T00:00:00Z"}})
+    clock[0] += 5
+    assert b"".join(app(environ, start_response)) == first
+
+    clock[0] += 60
+    fresh = b"".join(app(environ, start_response))
+    assert fresh != first
+    assert b"2024-01-01T00:00:00+00:00" in fresh
+
+
+def test_health_app_defers_config_load(tmp_path, monkeypatch):
+    config_path = tmp_path / "config.json"
+    monkeypatch.setenv("GRAPHITI_CONFIG_PATH", str(config_path))
+    app = HealthApp(state_store=GraphitiStateStore(base_dir=tmp_path / "state"))
+    assert not config_path.exists()
+    assert app.config.group_id == GraphitiConfig().group_id
+    assert config_path.exists()
+
+
+def test_health_app_head_and_unknown_path(tmp_path):
+    app = HealthApp(
+        config=GraphitiConfig(group_id="g"),
+        state_store=GraphitiStateStore(base_dir=tmp_path / "state"),
+    )
+    environ: dict[str, object] = {}
+    setup_testing_defaults(environ)
+    responses: list[tuple[str, dict[str, str]]] = []
+
+    def start_response(status, headers):
+        responses.append((status, dict(headers)))
+
+    environ["PATH_INFO"] = "/health/"
+    environ["REQUEST_METHOD"] = "HEAD"
+    assert app(environ, start_response) == [b""]
+    environ["PATH_INFO"] = "/other"
+    environ["REQUEST_METHOD"] = "GET"
+    app(environ, start_response)
+
+    assert responses[0][0] == "200 OK"
+    assert responses[0][1]["Content-Length"] == "0"
+    assert responses[1][0] == "404 Not Found"
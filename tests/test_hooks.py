@@ -22,6 +22,38 @@ def test_redaction_pipeline_applies_rules_recursively():
     assert stats == {"secret": 2, "digits": 2}
 
 
+def test_redaction_pipeline_reuses_untouched_containers():
+    pipeline = RedactionPipeline([RedactionRule.from_pattern(r"secret", "***", name="secret")])
+    clean = {"tags": ["a", "b"], "pair": ("x", 1)}
+    nested = {"note": "secret"}
+    payload = {"clean": clean, "nested": nested, "top": "secret"}
+
+    redacted, stats = pipeline.apply_structure(payload, in_place=True)
+
+    assert redacted is payload
+    assert redacted["clean"] is clean
+    assert redacted["nested"] == {"note": "***"}
+    assert nested == {"note": "secret"}
+    assert redacted["top"] == "***"
+    assert stats == {"secret": 2}
+
+
+def test_redaction_pipeline_combined_scan_matches_sequential_rules():
+    rules = [
+        RedactionRule.from_pattern(r"(?i)password", "***", name="password"),
+        RedactionRule.from_pattern(r"\*\*\*", "[MASKED]", name="mask"),
+        RedactionRule.from_pattern(r"(?P<d>\d)(?P=d)", "NN", name="pair"),
+    ]
+    pipeline = RedactionPipeline(rules)
+
+    assert pipeline.apply_text("nothing to hide") == ("nothing to hide", {})
+    # Later rules still see earlier replacements.
+    assert pipeline.apply_text("PASSWORD 11") == (
+        "[MASKED] NN",
+        {"password": 1, "mask": 1, "pair": 1},
+    )
+
+
 def test_episode_processor_redacts_and_summarises(tmp_path):
     rules_path = tmp_path / "rules.yaml"
     rules_path.write_text(
@@ -34,3 +34,32 @@ def test_log_store_categories(tmp_path):
 
     categories = store.categories()
     assert set(categories) == {"episodes", "system"}
+
+
+def test_log_store_tail_reads_backwards_across_chunks(tmp_path, monkeypatch):
+    monkeypatch.setattr("graphiti.logs._TAIL_CHUNK", 16)
+    store = GraphitiLogStore(tmp_path)
+    for index in range(20):
+        store.append("system", f"entry {index}")
+
+    records = store.tail("system", limit=3)
+    assert [record.message for record in records] == ["entry 17", "entry 18", "entry 19"]
+    assert len(store.tail("system", limit=0)) == 20
+
+
+def test_log_store_prune_streams_and_keeps_lines_verbatim(tmp_path):
+    store = GraphitiLogStore(tmp_path)
+    path = tmp_path / "system.log"
+    kept = '{"data": {"timestamp": "2000-01-01T00:00:00+00:00"}, "level": "INFO", "message": "new", "timestamp": "2999-01-01T00:00:00Z"}'
+    path.write_text(
+        '{"data": {}, "level": "INFO", "message": "old", "timestamp": "2000-01-01T00:00:00+00:00"}\n'
+        "not json\n"
+        f"{kept}\n",
+        encoding="utf-8",
+    )
+
+    store.prune(7)
+
+    assert path.read_text(encoding="utf-8") == f"{kept}\n"
+    assert [record.message for record in store.tail("system")] == ["new"]
+    assert not (tmp_path / "system.tmp").exists()
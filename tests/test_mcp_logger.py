@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+import sys
+import threading
+from dataclasses import replace
 from datetime import datetime, timezone
 
 import pytest
@@ -20,6 +23,20 @@ class InMemoryEpisodeStore:
         self.saved.append(episode)
 
 
+class BatchingEpisodeStore(InMemoryEpisodeStore):
+    def __init__(self, group_id: str) -> None:
+        super().__init__(group_id)
+        self.batches = []
+        self.batch_error: Exception | None = None
+
+    def upsert_episodes(self, episodes):
+        if self.batch_error is not None:
+            raise self.batch_error
+        self.batches.append(list(episodes))
+        self.saved.extend(episodes)
+        return len(episodes)
+
+
 @pytest.fixture()
 def turn() -> McpTurn:
     return McpTurn(
@@ -43,6 +60,35 @@ def test_logger_flushes_turns(turn):
     assert logger.pending() == 0
 
 
+def test_logger_flushes_in_one_batch_when_supported(turn, caplog):
+    store = BatchingEpisodeStore("group")
+    logger = McpEpisodeLogger(store, GraphitiConfig(group_id="group"))
+    logger.log_turn(turn)
+    logger.log_turn(replace(turn, message_id="msg2"))
+
+    assert logger.flush() == 2
+    assert [[episode.native_id for episode in batch] for batch in store.batches] == [["msg1", "msg2"]]
+
+    store.batch_error = RuntimeError("batch failed")
+    logger.log_turn(replace(turn, message_id="msg3"))
+    with caplog.at_level("WARNING", logger="graphiti.mcp.logger"):
+        assert logger.flush() == 1
+    assert store.saved[-1].native_id == "msg3"
+    assert caplog.records[0].exc_info[1] is store.batch_error
+
+
+def test_logger_does_not_retry_rejected_batches(turn):
+    store = BatchingEpisodeStore("group")
+    logger = McpEpisodeLogger(store, GraphitiConfig(group_id="group"))
+    store.batch_error = ValueError("group mismatch")
+    logger.log_turn(turn)
+
+    with pytest.raises(ValueError):
+        logger.flush()
+    assert store.saved == []
+    assert logger.pending() == 1
+
+
 def test_logger_trims_queue(turn):
     store = InMemoryEpisodeStore("group")
     logger = McpEpisodeLogger(store, GraphitiConfig(group_id="group"), queue_limit=1)
@@ -59,3 +105,35 @@ def test_logger_requeues_on_failure(turn):
     with pytest.raises(RuntimeError):
         logger.flush()
     assert logger.pending() == 1
+
+
+def test_logger_requeue_never_evicts_newer_turns(turn):
+    store = InMemoryEpisodeStore("group")
+    store.raise_error = True
+    logger = McpEpisodeLogger(store, GraphitiConfig(group_id="group"), queue_limit=16)
+    produced = [replace(turn, message_id=f"msg{index}") for index in range(2000)]
+
+    def produce() -> None:
+        for item in produced:
+            logger.log_turn(item)
+
+    # Switch threads as often as possible so producers interleave with requeues.
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        producer = threading.Thread(target=produce)
+        producer.start()
+        while producer.is_alive():
+            try:
+                logger.flush()
+            except RuntimeError:
+                pass
+        producer.join()
+    finally:
+        sys.setswitchinterval(interval)
+
+    store.raise_error = False
+    logger.flush()
+    assert [episode.native_id for episode in store.saved] == [
+        item.message_id for item in produced[-16:]
+    ]
@@ -1,8 +1,9 @@
 from __future__ import annotations
 
 import json
+import os
 
-from graphiti.ops import create_state_backup, restore_state_backup
+from graphiti.ops import create_state_backup, prune_backup_archives, restore_state_backup
 from graphiti.state import GraphitiStateStore
 
 
@@ -22,4 +23,21 @@ def test_create_and_restore_state_backup(tmp_path):
     assert restored_path == state_dir
     data = store.load_state()
     assert data["gmail"]["last_history_id"] == "123"
+    assert state_dir.stat().st_mode & 0o777 == 0o700
+    assert (state_dir / "state.json").stat().st_mode & 0o777 == 0o600
 
+
+
+def test_prune_backup_archives_covers_both_formats(tmp_path):
+    old_gz = tmp_path / "graphiti-state-20000101000000.tar.gz"
+    old_zst = tmp_path / "graphiti-state-20000101000000.tar.zst"
+    recent = tmp_path / "graphiti-state-29990101000000.tar.zst"
+    for path in (old_gz, old_zst, recent):
+        path.write_bytes(b"")
+    for path in (old_gz, old_zst):
+        os.utime(path, (0, 0))
+
+    removed = prune_backup_archives(tmp_path, 7)
+
+    assert set(removed) == {old_gz, old_zst}
+    assert recent.exists()
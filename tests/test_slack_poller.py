@@ -8,7 +8,12 @@ from typing import Iterable, Mapping
 import pytest
 
 from graphiti.config import GraphitiConfig
-from graphiti.pollers.slack import NullSlackClient, SlackPoller, SlackRateLimited
+from graphiti.pollers.slack import (
+    NullSlackClient,
+    SlackPoller,
+    SlackRateLimited,
+    channel_inventory,
+)
 from graphiti.state import GraphitiStateStore
 
 
@@ -42,8 +47,9 @@ class FakeSlackClient(NullSlackClient):
         self._messages = [dict(message) for message in messages]
         self._returned_once = False
 
-    def trigger_rate_limit(self) -> None:
+    def trigger_rate_limit(self, retry_after: float | None = 0) -> None:
         self._rate_limit_next = True
+        self._retry_after = retry_after
 
     def search_messages(
         self,
@@ -55,7 +61,7 @@ class FakeSlackClient(NullSlackClient):
         self.search_calls.append((query, oldest, cursor))
         if self._rate_limit_next:
             self._rate_limit_next = False
-            raise SlackRateLimited(0)
+            raise SlackRateLimited(self._retry_after)
         if self._returned_once:
             return {"messages": [], "next_cursor": None}
         filtered: list[Mapping[str, object]] = []
@@ -178,6 +184,22 @@ def test_slack_poller_handles_rate_limit(state_store: GraphitiStateStore, monkey
     assert slept and slept[0] >= 1.0
 
 
+def test_slack_poller_honours_retry_after(state_store: GraphitiStateStore, monkeypatch: pytest.MonkeyPatch) -> None:
+    config = GraphitiConfig(group_id="group", slack_search_query="in:general")
+    episode_store = InMemoryEpisodeStore(group_id="group")
+    client = FakeSlackClient()
+    client.channels["C1"] = {"id": "C1", "name": "general"}
+    client.queue_messages([{"ts": "1.0", "text": "Msg", "user": "U1", "channel": {"id": "C1"}}])
+    client.trigger_rate_limit(0.25)
+
+    slept: list[float] = []
+    monkeypatch.setattr(time, "sleep", slept.append)
+
+    poller = SlackPoller(client, episode_store, state_store, config=config)
+    assert poller.run_once() == 1
+    assert slept == [0.25]
+
+
 def test_slack_poller_backfill_respects_cutoff(state_store: GraphitiStateStore) -> None:
     config = GraphitiConfig(group_id="group", slack_search_query="in:general")
     episode_store = InMemoryEpisodeStore(group_id="group")
@@ -202,3 +224,8 @@ def test_slack_poller_backfill_respects_cutoff(state_store: GraphitiStateStore)
     slack_state = state_store.load_state()["slack"]
     assert slack_state["search"]["last_seen_ts"] == recent_ts
     assert slack_state["backfilled_days"] == 2
+
+
+def test_channel_inventory_skips_entries_without_id() -> None:
+    inventory = channel_inventory([{"id": "C1", "name": "general"}, {"name": "orphan"}, "bogus"])
+    assert inventory == {"C1": {"metadata": {"id": "C1", "name": "general"}}}
@@ -1,8 +1,10 @@
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from graphiti.state import GraphitiStateStore
+from graphiti.utils import loads_json
 
 
 def test_state_directory_created_with_permissions(tmp_path: Path, monkeypatch) -> None:
@@ -41,3 +43,38 @@ def test_record_and_clear_errors(tmp_path: Path, monkeypatch) -> None:
     store.clear_errors("gmail")
     state = store.load_state()
     assert "error_count" not in state["gmail"]
+
+
+def test_concurrent_updates_keep_every_section(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setattr("pathlib.Path.home", lambda: tmp_path)
+    store = GraphitiStateStore()
+    sources = [f"source{i}" for i in range(8)]
+    with ThreadPoolExecutor(max_workers=len(sources)) as executor:
+        for _ in range(5):
+            list(executor.map(lambda name: store.update_state({name: {"ok": True}}), sources))
+    state = store.load_state()
+    assert all(state[name] == {"ok": True} for name in sources)
+
+
+def test_load_state_reuses_parse_until_written(tmp_path: Path, monkeypatch) -> None:
+    store = GraphitiStateStore(base_dir=tmp_path / "state")
+    store.save_state({"gmail": {"last_history_id": "1"}})
+
+    calls: list[bytes] = []
+
+    def counting_loads(data):
+        calls.append(data)
+        return loads_json(data)
+
+    monkeypatch.setattr("graphiti.state.loads_json", counting_loads)
+    first = store.load_state()
+    first["drive"] = {"page_token": "local"}
+    first["gmail"]["last_history_id"] = "local"
+    second = store.load_state()
+    assert "drive" not in second
+    assert second["gmail"]["last_history_id"] == "1"
+    assert len(calls) == 1
+
+    store.update_state({"gmail": {"last_history_id": "2"}})
+    assert store.load_state()["gmail"]["last_history_id"] == "2"
+    assert len(calls) == 2
@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+import json
+import time
+from datetime import datetime, timezone
+
+from graphiti.utils import bounded_map, dumps_json, loads_json, utc_now_iso
+
+
+def test_dumps_json_matches_stdlib_layout():
+    payload = {"b": [1, 2], "a": {"nested": True}}
+    assert dumps_json(payload, indent=True, sort_keys=True) == json.dumps(
+        payload, indent=2, sort_keys=True
+    )
+    assert json.loads(dumps_json(payload)) == payload
+
+
+def test_dumps_json_falls_back_for_non_string_keys():
+    assert json.loads(dumps_json({1: "one"}, sort_keys=True)) == {"1": "one"}
+
+
+def test_utc_now_iso_reuses_value_within_a_second(monkeypatch):
+    monkeypatch.setattr(time, "time", lambda: 1704067200.25)
+    first = utc_now_iso()
+    monkeypatch.setattr(time, "time", lambda: 1704067200.75)
+    assert utc_now_iso() is first
+    assert datetime.fromisoformat(first) == datetime(2024, 1, 1, tzinfo=timezone.utc)
+    monkeypatch.setattr(time, "time", lambda: 1704067201.0)
+    assert utc_now_iso() == "2024-01-01T00:00:01+00:00"
+
+
+def test_bounded_map_preserves_input_order():
+    items = list(range(20))
+    assert list(bounded_map(lambda value: value * 2, items, 4)) == [v * 2 for v in items]
+    assert list(bounded_map(str, items, 1)) == [str(v) for v in items]
+
+
+def test_bounded_map_consumes_input_lazily():
+    consumed = []
+
+    def items():
+        for value in range(1000):
+            consumed.append(value)
+            yield value
+
+    results = bounded_map(lambda value: value * 2, items(), 4)
+    assert next(results) == 0
+    assert len(consumed) <= 9
+    results.close()
+    assert len(consumed) <= 9
+
+
+def test_loads_json_accepts_bytes_and_stdlib_literals():
+    assert loads_json(b'{"a": [1, 2.5, "x"]}') == {"a": [1, 2.5, "x"]}
+    assert loads_json("[NaN]")[0] != loads_json("[NaN]")[0]